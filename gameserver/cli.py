@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
-import subprocess
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Callable, List, Optional, ParamSpec, TypeVar
 
 import typer
 from rich.console import Console
+from rich.text import Text
 
 from .exceptions import GameServerError
-from .services.downloaders import DownloadManager
-from .services.registry import ServiceRegistry
-from .services.systemd import SystemdService
-from .services.validation import ValidationService
+from .services.filesystem import format_size
+
+if TYPE_CHECKING:
+    from .models import DownloadMarker, ServiceConfig
+    from .services.downloaders import DownloadManager
+    from .services.registry import ServiceRegistry
 
 # Initialize Typer app and Rich console
 app = typer.Typer(
@@ -23,9 +28,36 @@ app = typer.Typer(
 )
 console = Console()
 
-# Global service registry and download manager
-registry = ServiceRegistry()
-download_manager = DownloadManager()
+# Static command summary shown by `status`
+HELP_BLOCK = """\
+Available commands:
+  gameserver status              - Show this status
+  gameserver list                - List available games
+  gameserver start <game>        - Start a game service
+  gameserver stop <game>         - Stop a game service
+  gameserver restart <game>      - Restart a game service
+  gameserver clean <game>        - Clean/uninstall a game (stop, remove files)
+  gameserver logs <game>         - Show recent logs
+  gameserver update <game>       - Update game files
+  gameserver info <game>         - Show game information
+
+Note: Games run as transient systemd units (no persistent auto-start)"""
+
+
+# Service modules pull in Pydantic and friends, so they are imported lazily
+# inside the commands that need them to keep CLI start-up fast.
+@functools.cache
+def _registry() -> ServiceRegistry:
+    """Get the global service registry, loading it on first use."""
+    from .services.registry import ServiceRegistry
+    return ServiceRegistry()
+
+
+@functools.cache
+def _download_manager() -> DownloadManager:
+    """Get the global download manager, creating it on first use."""
+    from .services.downloaders import DownloadManager
+    return DownloadManager()
 
 
 def handle_error(error: Exception) -> None:
@@ -39,6 +71,19 @@ def handle_error(error: Exception) -> None:
     raise typer.Exit(1)
 
 
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def buffered_output(func: Callable[P, R]) -> Callable[P, R]:
+    """Buffer a command's console output and write it out once on return."""
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        with console:
+            return func(*args, **kwargs)
+    return wrapper
+
+
 def format_game_source(game_source) -> str:
     """Format game source information for display."""
     source_info = f"{game_source.type.title()}"
@@ -51,47 +96,85 @@ def format_game_source(game_source) -> str:
     return source_info
 
 
+@dataclass
+class GameState:
+    """Installation state of a game, gathered once per command."""
+    
+    marker: DownloadMarker | None = None
+    marker_error: bool = False
+
+
+def load_game_state(config: ServiceConfig) -> GameState:
+    """Read a game's download marker once.
+    
+    A missing game directory makes the marker lookup report "not found",
+    so the directory itself is not probed separately.
+    """
+    from .services.validation import ValidationService
+    
+    try:
+        marker = ValidationService.validate_download_marker(config.marker_file)
+    except Exception:
+        return GameState(marker_error=True)
+    return GameState(marker=marker)
+
+
+def remove_path(path: Path) -> Path:
+    """Remove a file or directory tree, ignoring paths that are already gone."""
+    import shutil
+    
+    try:
+        if path.is_dir() and not path.is_symlink():
+            shutil.rmtree(path)
+        else:
+            path.unlink()
+    except FileNotFoundError:
+        pass
+    return path
+
+
+def print_port_status(ports: List[int], listening: frozenset[int] | None) -> None:
+    """Print whether each port is listening, given one port lookup for all of them."""
+    for port in ports:
+        if listening is None:
+            console.print(f"  Port {port}: [yellow]unknown[/yellow]")
+        elif port in listening:
+            console.print(f"  Port {port}: [green]LISTENING[/green]")
+        else:
+            console.print(f"  Port {port}: [red]closed[/red]")
+
+
 @app.command()
+@buffered_output
 def status() -> None:
     """Show all game services and their status."""
+    from .services.systemd import SystemdService
+    
     console.print("[bold cyan]=== Game Server Services ===[/bold cyan]")
     console.print()
     
-    games = registry.list_games()
+    games = _registry().list_games()
     if not games:
         console.print("[yellow](no games configured)[/yellow]")
         console.print()
-        console.print("Available commands:")
-        console.print("  gameserver status              - Show this status")
-        console.print("  gameserver list                - List available games")
-        console.print("  gameserver start <game>        - Start a game service")
-        console.print("  gameserver stop <game>         - Stop a game service")
-        console.print("  gameserver restart <game>      - Restart a game service")
-        console.print("  gameserver clean <game>        - Clean/uninstall a game")
-        console.print("  gameserver logs <game>         - Show recent logs")
-        console.print("  gameserver update <game>       - Update game files")
-        console.print("  gameserver info <game>         - Show game information")
-        console.print()
-        console.print("Note: Games run as transient systemd units (no persistent auto-start)")
+        console.print(HELP_BLOCK, markup=False, highlight=False)
         return
     
     console.print("[bold]Game Services:[/bold]")
     
+    statuses = SystemdService.get_status_many([config.unit_name for config in games])
+    
     for config in games:
-        service_status = SystemdService.get_status(config.unit_name)
+        service_status = statuses[config.unit_name]
         
         # Check download status
         download_status = "not-downloaded"
         if config.game_source.type == "steam":
-            marker_file = config.game_dir / ".steamcmd-completed"
-            try:
-                marker = ValidationService.validate_download_marker(marker_file)
-                if marker and marker.download_status == "success":
-                    download_status = "success"
-                elif marker:
-                    download_status = marker.download_status
-            except Exception:
+            state = load_game_state(config)
+            if state.marker_error:
                 download_status = "unknown"
+            elif state.marker:
+                download_status = state.marker.download_status
         else:
             download_status = "n/a"
         
@@ -99,30 +182,25 @@ def status() -> None:
         service_color = "green" if service_status == "active" else "red" if service_status == "failed" else "yellow"
         download_color = "green" if download_status == "success" else "red" if download_status == "failed" else "yellow"
         
-        console.print(f"  {config.name} ({config.id}) - Service: [{service_color}]{service_status}[/{service_color}], Files: [{download_color}]{download_status}[/{download_color}]")
+        console.print(Text.assemble(
+            f"  {config.name} ({config.id}) - Service: ",
+            (service_status, service_color),
+            ", Files: ",
+            (download_status, download_color),
+        ))
     
     console.print()
-    console.print("Available commands:")
-    console.print("  gameserver status              - Show this status")
-    console.print("  gameserver list                - List available games")
-    console.print("  gameserver start <game>        - Start a game service")
-    console.print("  gameserver stop <game>         - Stop a game service")
-    console.print("  gameserver restart <game>      - Restart a game service")
-    console.print("  gameserver clean <game>        - Clean/uninstall a game (stop, remove files)")
-    console.print("  gameserver logs <game>         - Show recent logs")
-    console.print("  gameserver update <game>       - Update game files")
-    console.print("  gameserver info <game>         - Show game information")
-    console.print()
-    console.print("Note: Games run as transient systemd units (no persistent auto-start)")
+    console.print(HELP_BLOCK, markup=False, highlight=False)
 
 
 @app.command()
+@buffered_output
 def list() -> None:
     """List available games with details."""
     console.print("[bold cyan]=== Available Games ===[/bold cyan]")
     console.print()
     
-    games = registry.list_games()
+    games = _registry().list_games()
     if not games:
         console.print("No games configured.")
         return
@@ -136,10 +214,14 @@ def list() -> None:
 
 
 @app.command()
+@buffered_output
 def info(game: str) -> None:
     """Show detailed information about a specific game."""
+    from .services.network import get_listening_ports
+    from .services.systemd import SystemdService
+    
     try:
-        config = registry.get_config(game)
+        config = _registry().get_config(game)
     except Exception as e:
         handle_error(e)
     
@@ -165,47 +247,34 @@ def info(game: str) -> None:
     
     # Show download status if marker exists
     if config.game_source.type == "steam":
-        marker_file = config.game_dir / ".steamcmd-completed"
-        try:
-            marker = ValidationService.validate_download_marker(marker_file)
-            if marker:
-                console.print()
-                console.print("[bold cyan]=== Download Status ===[/bold cyan]")
-                console.print(f"Last Updated: {marker.last_updated}")
-                console.print(f"Source: {marker.game_source.type.title()} (ID: {marker.game_source.source_id})")
-                if marker.game_source.metadata.get("branch"):
-                    console.print(f"Branch: {marker.game_source.metadata['branch']}")
-                console.print(f"Download Status: {marker.download_status}")
-                console.print(f"File Count: {marker.file_count}")
-                console.print(f"Total Size: {marker.total_size}")
-                console.print(f"Validation: {marker.validation_status}")
-            else:
-                console.print()
-                console.print("[bold cyan]=== Download Status ===[/bold cyan]")
-                console.print("Status: Not downloaded or invalid marker file")
-        except Exception:
-            console.print()
-            console.print("[bold cyan]=== Download Status ===[/bold cyan]")
+        state = load_game_state(config)
+        marker = state.marker
+        console.print()
+        console.print("[bold cyan]=== Download Status ===[/bold cyan]")
+        if state.marker_error:
             console.print("Status: Invalid marker file")
+        elif marker:
+            console.print(f"Last Updated: {marker.last_updated}")
+            console.print(f"Source: {marker.game_source.type.title()} (ID: {marker.game_source.source_id})")
+            if marker.game_source.metadata.get("branch"):
+                console.print(f"Branch: {marker.game_source.metadata['branch']}")
+            console.print(f"Download Status: {marker.download_status}")
+            console.print(f"File Count: {marker.file_count}")
+            console.print(f"Total Size: {marker.total_size}")
+            console.print(f"Validation: {marker.validation_status}")
+        else:
+            console.print("Status: Not downloaded or invalid marker file")
     
     # Show port status if ports are defined
     if config.ports:
         console.print()
         console.print("[bold cyan]=== Port Status ===[/bold cyan]")
-        for port in config.ports:
-            try:
-                result = subprocess.run(
-                    ["ss", "-tuln"],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                if f":{port} " in result.stdout:
-                    console.print(f"  Port {port}: [green]LISTENING[/green]")
-                else:
-                    console.print(f"  Port {port}: [red]closed[/red]")
-            except Exception:
-                console.print(f"  Port {port}: [yellow]unknown[/yellow]")
+        try:
+            listening = get_listening_ports()
+        except Exception:
+            listening = None
+        
+        print_port_status(config.ports, listening)
 
 
 @app.command()
@@ -214,15 +283,17 @@ def update(
     force: bool = typer.Option(False, "--force", help="Force re-download even if files exist")
 ) -> None:
     """Update/download game files using SteamCMD."""
+    from .services.validation import ValidationService
+    
     try:
-        config = registry.get_config(game)
+        config = _registry().get_config(game)
         
         if config.game_source.type != "steam":
             console.print(f"[red]Only Steam games are currently supported for download. {config.name} uses {config.game_source.type}[/red]")
             raise typer.Exit(1)
         
         # Check if download is needed
-        marker_file = config.game_dir / ".steamcmd-completed"
+        marker_file = config.marker_file
             
         if not force and not ValidationService.needs_download(marker_file, config.game_source, force):
             try:
@@ -234,7 +305,8 @@ def update(
             except Exception:
                 pass
         
-        download_manager.download_game(config, force)
+        _download_manager().download_game(config, force)
+        ValidationService.clear_cache()
         
     except Exception as e:
         handle_error(e)
@@ -243,8 +315,12 @@ def update(
 @app.command()
 def start(game: str) -> None:
     """Start a game service."""
+    from .services.network import invalidate_ports_cache
+    from .services.systemd import SystemdService
+    from .services.validation import ValidationService
+    
     try:
-        config = registry.get_config(game)
+        config = _registry().get_config(game)
         
         console.print(f"Starting {config.name}...")
         
@@ -254,6 +330,7 @@ def start(game: str) -> None:
             console.print("[green]✓ Game files verified[/green]")
         
         SystemdService.start_service(config)
+        invalidate_ports_cache()
         
     except Exception as e:
         handle_error(e)
@@ -262,10 +339,14 @@ def start(game: str) -> None:
 @app.command()
 def stop(game: str) -> None:
     """Stop a game service."""
+    from .services.network import invalidate_ports_cache
+    from .services.systemd import SystemdService
+    
     try:
-        config = registry.get_config(game)
+        config = _registry().get_config(game)
         console.print(f"Stopping {config.name}...")
         SystemdService.stop_service(config)
+        invalidate_ports_cache()
         
     except Exception as e:
         handle_error(e)
@@ -274,9 +355,13 @@ def stop(game: str) -> None:
 @app.command()
 def restart(game: str) -> None:
     """Restart a game service."""
+    from .services.network import invalidate_ports_cache
+    from .services.systemd import SystemdService
+    
     try:
-        config = registry.get_config(game)
+        config = _registry().get_config(game)
         SystemdService.restart_service(config)
+        invalidate_ports_cache()
         
     except Exception as e:
         handle_error(e)
@@ -290,8 +375,10 @@ def logs(
     args: Optional[List[str]] = typer.Option(None, "--args", help="Additional arguments to pass to journalctl")
 ) -> None:
     """Show recent logs for a game."""
+    from .services.systemd import SystemdService
+    
     try:
-        config = registry.get_config(game)
+        config = _registry().get_config(game)
         
         if args is None:
             args = ["--no-pager"]
@@ -313,8 +400,12 @@ def clean(
     all_data: bool = typer.Option(False, "--all", help="Clean everything")
 ) -> None:
     """Clean/uninstall a game (stop service, remove files)."""
+    from .services.filesystem import dir_size_bytes
+    from .services.systemd import SystemdService
+    from .services.validation import ValidationService
+    
     try:
-        config = registry.get_config(game)
+        config = _registry().get_config(game)
         
         clean_user_data = user_data or all_data
         
@@ -340,20 +431,14 @@ def clean(
             
             # Get directory size
             try:
-                result = subprocess.run(
-                    ["du", "-sh", str(config.game_dir)],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                size = result.stdout.split()[0]
-                console.print(f"   Size: {size}")
+                console.print(f"   Size: {format_size(dir_size_bytes(config.game_dir))}")
             except Exception:
                 console.print("   Size: unknown")
             
             if typer.confirm("   Remove game installation directory?"):
                 import shutil
                 shutil.rmtree(config.game_dir)
+                ValidationService.clear_cache()
                 console.print("   [green]✓ Game files removed[/green]")
             else:
                 console.print("   [yellow]✓ Game files kept[/yellow]")
@@ -365,21 +450,20 @@ def clean(
             console.print("3. Cleaning user data...")
             console.print("   Files that would be removed:")
             
-            for filter_path in config.clean_filters:
-                expanded_path = Path(filter_path).expanduser()
-                if expanded_path.exists():
-                    console.print(f"     - {expanded_path}")
+            # Expand and check each filter once for both listing and removal
+            existing_paths = [
+                expanded_path
+                for expanded_path in (Path(filter_path).expanduser() for filter_path in config.clean_filters)
+                if expanded_path.exists()
+            ]
+            for expanded_path in existing_paths:
+                console.print(f"     - {expanded_path}")
             
             if typer.confirm("   Remove user data?"):
-                for filter_path in config.clean_filters:
-                    expanded_path = Path(filter_path).expanduser()
-                    if expanded_path.exists():
-                        if expanded_path.is_dir():
-                            import shutil
-                            shutil.rmtree(expanded_path)
-                        else:
-                            expanded_path.unlink()
-                        console.print(f"     [green]✓ Removed: {expanded_path}[/green]")
+                # Independent trees, so unlink work can overlap across threads
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    for removed_path in executor.map(remove_path, existing_paths):
+                        console.print(f"     [green]✓ Removed: {removed_path}[/green]")
                 console.print("     [green]✓ User data cleaned[/green]")
             else:
                 console.print("     [yellow]✓ User data kept[/yellow]")
@@ -394,128 +478,106 @@ def clean(
 
 
 @app.command()
+@buffered_output
 def network() -> None:
     """Show game server ports and network status."""
+    from .services.network import GAME_PORT_RANGE, get_listening
+    from .services.systemd import SystemdService
+    
     console.print("[bold cyan]=== Network Status ===[/bold cyan]")
     console.print()
     
-    games = registry.list_games()
+    games = _registry().list_games()
     if not games:
         console.print("No games configured.")
         return
     
+    listening: frozenset[int] | None
+    game_ports: frozenset[int] | None
+    try:
+        listening, game_ports = get_listening()
+    except Exception:
+        listening = game_ports = None
+    
+    statuses = SystemdService.get_status_many([config.unit_name for config in games])
+    
     for config in games:
-        service_status = SystemdService.get_status(config.unit_name)
+        service_status = statuses[config.unit_name]
         status_color = "green" if service_status == "active" else "red" if service_status == "failed" else "yellow"
         
-        console.print(f"{config.name} ({config.id}) - [{status_color}]{service_status}[/{status_color}]:")
+        console.print(Text.assemble(
+            f"{config.name} ({config.id}) - ",
+            (service_status, status_color),
+            ":",
+        ))
         
         if config.ports:
-            for port in config.ports:
-                try:
-                    result = subprocess.run(
-                        ["ss", "-tuln"],
-                        capture_output=True,
-                        text=True,
-                        check=True
-                    )
-                    if f":{port} " in result.stdout:
-                        console.print(f"  Port {port}: [green]LISTENING[/green]")
-                    else:
-                        console.print(f"  Port {port}: [red]closed[/red]")
-                except Exception:
-                    console.print(f"  Port {port}: [yellow]unknown[/yellow]")
+            print_port_status(config.ports, listening)
         else:
             console.print("  No ports configured")
         console.print()
     
-    console.print("All listening ports in game range (26000-28000):")
-    try:
-        result = subprocess.run(
-            ["ss", "-tuln"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        game_ports = []
-        for line in result.stdout.split('\n'):
-            for port in range(26000, 28001):
-                if f":{port} " in line:
-                    game_ports.append(f"  Port {port}: LISTENING")
-        
-        if game_ports:
-            for port_line in game_ports:
-                console.print(port_line)
-        else:
-            console.print("  No game ports active")
-    except Exception:
+    console.print(f"All listening ports in game range ({GAME_PORT_RANGE.start}-{GAME_PORT_RANGE[-1]}):")
+    if game_ports is None:
         console.print("  Error checking ports")
+        return
+    
+    if game_ports:
+        for port in sorted(game_ports):
+            console.print(f"  Port {port}: LISTENING")
+    else:
+        console.print("  No game ports active")
 
 
 @app.command()
+@buffered_output
 def disk() -> None:
     """Show disk usage for game files."""
+    from .services.filesystem import dir_size_bytes
+    
     console.print("[bold cyan]=== Disk Usage ===[/bold cyan]")
     console.print()
     
-    games = registry.list_games()
+    games = _registry().list_games()
     if not games:
         console.print("No games configured.")
         return
     
+    states = {config.id: load_game_state(config) for config in games}
+    
+    # Walk all game directories concurrently; the walks are I/O-bound. A
+    # missing directory fails the walk itself, so it is not probed first.
+    with ThreadPoolExecutor(max_workers=min(8, len(games))) as executor:
+        size_futures = {
+            config.id: executor.submit(dir_size_bytes, config.game_dir)
+            for config in games
+        }
+    
     total_size_bytes = 0
     
     for config in games:
-        if config.game_dir.exists():
-            try:
-                # Get directory size
-                result = subprocess.run(
-                    ["du", "-sb", str(config.game_dir)],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                size_bytes = int(result.stdout.split()[0])
-                total_size_bytes += size_bytes
-                
-                # Get human readable size
-                result = subprocess.run(
-                    ["du", "-sh", str(config.game_dir)],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                size = result.stdout.split()[0]
-                
-                # Check for download info
-                download_info = ""
-                marker_file = config.game_dir / ".steamcmd-completed"
-                try:
-                    marker = ValidationService.validate_download_marker(marker_file)
-                    if marker:
-                        download_info = f" ({marker.file_count} files, updated: {marker.last_updated.strftime('%Y-%m-%d %H:%M')})"
-                except Exception:
-                    pass
-                
-                console.print(f"{config.name} ({config.id}): {size}{download_info}")
-                console.print(f"  Path: {config.game_dir}")
-            except Exception:
-                console.print(f"{config.name} ({config.id}): error reading size")
-                console.print(f"  Path: {config.game_dir}")
-        else:
+        try:
+            size_bytes = size_futures[config.id].result()
+        except (FileNotFoundError, NotADirectoryError):
             console.print(f"{config.name} ({config.id}): not downloaded")
+        except Exception:
+            console.print(f"{config.name} ({config.id}): error reading size")
+            console.print(f"  Path: {config.game_dir}")
+        else:
+            total_size_bytes += size_bytes
+            size = format_size(size_bytes)
+            
+            # Check for download info
+            download_info = ""
+            marker = states[config.id].marker
+            if marker:
+                download_info = f" ({marker.file_count} files, updated: {marker.last_updated.strftime('%Y-%m-%d %H:%M')})"
+            
+            console.print(f"{config.name} ({config.id}): {size}{download_info}")
+            console.print(f"  Path: {config.game_dir}")
         console.print()
     
     if total_size_bytes > 0:
-        # Convert to human readable
-        def format_size(size_bytes: int) -> str:
-            for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-                if size_bytes < 1024:
-                    return f"{size_bytes:.1f}{unit}"
-                size_bytes /= 1024
-            return f"{size_bytes:.1f}PB"
-        
         total_human = format_size(total_size_bytes)
         console.print(f"[bold]Total game files: {total_human}[/bold]")
 
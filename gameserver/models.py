@@ -11,6 +11,9 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator
 # Type alias for supported game source types
 GameSourceType = Literal["steam", "gog", "lutris", "direct", "manual"]
 
+# Name of the download completion marker inside a game directory
+MARKER_FILENAME = ".steamcmd-completed"
+
 
 class GameSource(BaseModel):
     """Model for game source information."""
@@ -20,6 +23,11 @@ class GameSource(BaseModel):
     metadata: dict[str, str] = Field(default_factory=dict, description="Source-specific metadata")
     
     model_config = ConfigDict(populate_by_name=True)
+    
+    @property
+    def key(self) -> tuple[str, str]:
+        """Identity of the downloaded content: (type, source_id), ignoring metadata."""
+        return self.type, self.source_id
 
 
 class ServiceConfig(BaseModel):
@@ -47,6 +55,11 @@ class ServiceConfig(BaseModel):
     clean_filters: list[str] = Field(default_factory=list, alias="cleanFilters", description="Paths to clean during uninstall")
     shutdown_command: list[str] | None = Field(None, alias="shutdownCommand", description="Custom shutdown command (if not using systemctl stop)")
     
+    @property
+    def marker_file(self) -> Path:
+        """Path of the download completion marker in the game directory."""
+        return self.game_dir / MARKER_FILENAME
+    
     @field_validator("group")
     @classmethod
     def default_group(cls, v: str | None, info) -> str:
@@ -84,6 +97,7 @@ class DownloadMarker(BaseModel):
     total_size: str = Field(..., description="Total download size")
     validation_status: str = Field(..., description="Validation status")
     last_updated: datetime = Field(..., description="Last update timestamp")
+    executable_size: int | None = Field(None, description="Size of the game executable in bytes")
     
     @field_validator("download_status")
     @classmethod
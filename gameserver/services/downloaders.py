@@ -4,14 +4,22 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import ClassVar
 
 from ..models import ServiceConfig, DownloadMarker
 from ..exceptions import GameServerError
+from .validation import ValidationService
 
 
 # Registry for decorated downloaders
 _registered_downloaders: list[type[BaseDownloader]] = []
 
+# Decorated downloaders that declare a source_type, keyed by that type
+_BY_TYPE: dict[str, type[BaseDownloader]] = {}
+
+# Shared instances of decorated downloaders, created on first use
+_instance_cache: dict[type[BaseDownloader], BaseDownloader] = {}
+
 
 def register_downloader(cls: type[BaseDownloader]) -> type[BaseDownloader]:
     """Decorator to automatically register downloaders.
@@ -23,12 +31,17 @@ def register_downloader(cls: type[BaseDownloader]) -> type[BaseDownloader]:
         The same class (for decorator chaining)
     """
     _registered_downloaders.append(cls)
+    if cls.source_type is not None:
+        _BY_TYPE[cls.source_type] = cls
     return cls
 
 
 class BaseDownloader(ABC):
     """Abstract base class for game downloaders."""
     
+    # Game source type handled by this downloader, if dispatch is by type alone
+    source_type: ClassVar[str | None] = None
+    
     @abstractmethod
     def can_handle(self, config: ServiceConfig) -> bool:
         """Check if this downloader can handle the given configuration."""
@@ -81,12 +94,19 @@ class BaseDownloader(ABC):
         Returns:
             DownloadMarker object or None if not found/invalid
         """
+        # Shares the validation service's cache of parsed markers
         try:
-            if marker_file.exists():
-                return DownloadMarker.model_validate_json(marker_file.read_text())
+            return ValidationService.validate_download_marker(marker_file)
         except Exception:
-            pass
-        return None
+            return None
+
+
+def _get_instance(downloader_cls: type[BaseDownloader]) -> BaseDownloader:
+    """Get the shared instance of a decorated downloader class."""
+    downloader = _instance_cache.get(downloader_cls)
+    if downloader is None:
+        downloader = _instance_cache[downloader_cls] = downloader_cls()
+    return downloader
 
 
 class DownloadManager:
@@ -94,28 +114,60 @@ class DownloadManager:
     
     def __init__(self):
         self._downloaders: list[BaseDownloader] = []
+        # Resolved downloader per game source (type, source_id)
+        self._resolver_cache: dict[tuple[str, str], BaseDownloader] = {}
     
     def register_downloader(self, downloader: BaseDownloader) -> None:
         """Register a new downloader."""
         self._downloaders.append(downloader)
+        self.invalidate()
+    
+    def invalidate(self) -> None:
+        """Forget previously resolved downloaders."""
+        self._resolver_cache.clear()
     
     def get_downloader(self, config: ServiceConfig) -> BaseDownloader:
-        """Get appropriate downloader for the given configuration."""
+        """Get appropriate downloader for the given configuration.
+        
+        The result is cached per game source type and ID, which is what
+        downloaders' ``can_handle`` checks decide on.
+        """
+        key = config.game_source.key
+        cached = self._resolver_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        downloader = self._find_downloader(config)
+        if downloader is not None:
+            self._resolver_cache[key] = downloader
+            return downloader
+        
+        raise GameServerError(
+            f"No downloader available for game source: {config.game_source}",
+            config.id
+        )
+    
+    def _find_downloader(self, config: ServiceConfig) -> BaseDownloader | None:
+        """Scan registered downloaders for one that can handle the configuration."""
         # Check manually registered downloaders first
         for downloader in self._downloaders:
             if downloader.can_handle(config):
                 return downloader
         
+        # Direct lookup for downloaders that declare their source type
+        downloader_cls = _BY_TYPE.get(config.game_source.type)
+        if downloader_cls is not None:
+            downloader = _get_instance(downloader_cls)
+            if downloader.can_handle(config):
+                return downloader
+        
         # Check decorated downloaders from the registry
         for downloader_cls in _registered_downloaders:
-            downloader = downloader_cls()
+            downloader = _get_instance(downloader_cls)
             if downloader.can_handle(config):
                 return downloader
         
-        raise GameServerError(
-            f"No downloader available for game source: {config.game_source}",
-            config.id
-        )
+        return None
     
     def download_game(self, config: ServiceConfig, force: bool = False) -> None:
         """Download a game using the appropriate downloader."""
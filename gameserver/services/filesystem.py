@@ -0,0 +1,79 @@
+"""Filesystem helpers for inspecting game installations."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
+def walk_sizes(path: Path) -> tuple[int, int]:
+    """Count the regular files below a directory and sum their sizes.
+
+    Walks the tree with ``os.scandir`` so file types come from the cached
+    directory entries and no ``Path`` objects are created per file. Symlinks
+    are not followed. Unreadable subdirectories and files are skipped.
+
+    Args:
+        path: Directory to measure
+
+    Returns:
+        Tuple of (file count, total size in bytes)
+
+    Raises:
+        OSError: If the top-level directory cannot be read
+    """
+    root = os.fspath(path)
+    file_count = 0
+    total = 0
+    stack = [root]
+
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                            file_count += 1
+                    except OSError:
+                        continue
+        except OSError:
+            if current == root:
+                raise
+
+    return file_count, total
+
+
+def dir_size_bytes(path: Path) -> int:
+    """Get the total size of all regular files below a directory.
+
+    Args:
+        path: Directory to measure
+
+    Returns:
+        Total size in bytes
+
+    Raises:
+        OSError: If the top-level directory cannot be read
+    """
+    return walk_sizes(path)[1]
+
+
+def format_size(size_bytes: int, units: tuple[str, ...] = SIZE_UNITS) -> str:
+    """Format a byte count in human-readable form.
+
+    Args:
+        size_bytes: Size in bytes
+        units: Labels for successive powers of 1024, starting at bytes
+
+    Returns:
+        Size with one decimal place in the largest fitting unit (e.g. "1.5KB")
+    """
+    # Each unit is 2**10 times the previous one, so the bit length picks it
+    unit = min(max(0, (size_bytes.bit_length() - 1) // 10), len(units) - 1)
+    return f"{size_bytes / (1 << (10 * unit)):.1f}{units[unit]}"
@@ -0,0 +1,84 @@
+"""Listening port enumeration through the Linux sock_diag netlink interface.
+
+This is the same kernel interface ``ss`` uses, queried in-process so that no
+subprocess has to be spawned and no text output has to be parsed.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import struct
+
+NETLINK_SOCK_DIAG = 4
+SOCK_DIAG_BY_FAMILY = 20
+
+NLM_F_REQUEST = 0x01
+NLM_F_DUMP = 0x300
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+
+# Kernel TCP states; bound but unconnected UDP sockets report TCP_CLOSE
+TCP_LISTEN = 10
+TCP_CLOSE = 7
+LISTENING_STATES = (1 << TCP_LISTEN) | (1 << TCP_CLOSE)
+
+# struct nlmsghdr: len, type, flags, seq, pid
+_NLMSG_HEADER = struct.Struct("=IHHII")
+# struct inet_diag_req_v2: family, protocol, ext, pad, states, zeroed sockid
+_INET_DIAG_REQ_V2 = struct.Struct("=BBBBI48x")
+# struct inet_diag_msg starts with family, state, timer, retrans, then the
+# big-endian source port of its inet_diag_sockid
+_INET_DIAG_SPORT = struct.Struct("!H")
+_INET_DIAG_SPORT_OFFSET = 4
+
+
+def _query(family: int, protocol: int) -> set[int]:
+    """Dump the local ports of listening sockets for one family/protocol."""
+    request = _INET_DIAG_REQ_V2.pack(family, protocol, 0, 0, LISTENING_STATES)
+    header = _NLMSG_HEADER.pack(
+        _NLMSG_HEADER.size + len(request),
+        SOCK_DIAG_BY_FAMILY,
+        NLM_F_REQUEST | NLM_F_DUMP,
+        1,
+        0
+    )
+
+    ports: set[int] = set()
+    with socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_SOCK_DIAG) as sock:
+        sock.sendto(header + request, (0, 0))
+        while True:
+            data = sock.recv(65536)
+            offset = 0
+            while offset + _NLMSG_HEADER.size <= len(data):
+                length, msg_type, _, _, _ = _NLMSG_HEADER.unpack_from(data, offset)
+                if length < _NLMSG_HEADER.size:
+                    raise OSError("Malformed netlink message")
+                if msg_type == NLMSG_DONE:
+                    return ports
+                if msg_type == NLMSG_ERROR:
+                    (error,) = struct.unpack_from("=i", data, offset + _NLMSG_HEADER.size)
+                    raise OSError(-error, os.strerror(-error))
+
+                payload = offset + _NLMSG_HEADER.size
+                (port,) = _INET_DIAG_SPORT.unpack_from(data, payload + _INET_DIAG_SPORT_OFFSET)
+                ports.add(port)
+
+                # Messages are padded to 4-byte boundaries
+                offset += (length + 3) & ~3
+
+
+def list_listening_ports() -> set[int]:
+    """Get all locally listening TCP/UDP ports over IPv4 and IPv6.
+
+    Returns:
+        Set of listening port numbers
+
+    Raises:
+        OSError: If netlink is unavailable (non-Linux, sandboxed, etc.)
+    """
+    ports: set[int] = set()
+    for family in (socket.AF_INET, socket.AF_INET6):
+        for protocol in (socket.IPPROTO_TCP, socket.IPPROTO_UDP):
+            ports |= _query(family, protocol)
+    return ports
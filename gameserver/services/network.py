@@ -0,0 +1,79 @@
+"""Network port inspection for game servers."""
+
+from __future__ import annotations
+
+import subprocess
+import time
+
+from .netlink_ports import list_listening_ports
+
+# Port range treated as game traffic
+GAME_PORT_RANGE = range(26000, 28001)
+
+# (timestamp, all ports, game-range ports) of the last successful port query
+_SS_CACHE: tuple[float, frozenset[int], frozenset[int]] | None = None
+
+
+def _read_listening_ports() -> frozenset[int]:
+    """Get all locally listening TCP/UDP ports.
+
+    Queries the kernel over netlink directly and falls back to a single
+    ``ss`` call where netlink is unavailable.
+    """
+    try:
+        return frozenset(list_listening_ports())
+    except (OSError, AttributeError):
+        pass
+
+    result = subprocess.run(
+        ["ss", "-tuln"],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    ports = set()
+    for line in result.stdout.splitlines():
+        columns = line.split()
+        if len(columns) < 5:
+            continue
+        # Local address column looks like 0.0.0.0:26900 or [::]:26900
+        port = columns[4].rsplit(":", 1)[-1]
+        if port.isdigit():
+            ports.add(int(port))
+    return frozenset(ports)
+
+
+def get_listening(ttl: float = 2.0) -> tuple[frozenset[int], frozenset[int]]:
+    """Get listening ports, reusing a recent result if one is available.
+
+    Args:
+        ttl: Maximum age in seconds of a cached result
+
+    Returns:
+        Tuple of (all listening ports, listening ports in GAME_PORT_RANGE)
+
+    Raises:
+        subprocess.CalledProcessError: If the ``ss`` fallback fails
+    """
+    global _SS_CACHE
+
+    now = time.monotonic()
+    if _SS_CACHE is not None and now - _SS_CACHE[0] < ttl:
+        return _SS_CACHE[1], _SS_CACHE[2]
+
+    ports = _read_listening_ports()
+    game_ports = frozenset(port for port in ports if port in GAME_PORT_RANGE)
+    _SS_CACHE = (now, ports, game_ports)
+    return ports, game_ports
+
+
+def get_listening_ports(ttl: float = 2.0) -> frozenset[int]:
+    """Get all listening TCP/UDP port numbers (see ``get_listening``)."""
+    return get_listening(ttl)[0]
+
+
+def invalidate_ports_cache() -> None:
+    """Forget the cached port list (e.g. after starting or stopping a service)."""
+    global _SS_CACHE
+    _SS_CACHE = None
@@ -1,35 +1,97 @@
 """Service registry handling for game configurations."""
 
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from pydantic import BaseModel
 from rich.console import Console
 
+from .. import __version__
 from ..exceptions import GameNotFoundError, ValidationError
 from ..models import ServiceConfig
 
 console = Console()
 
+# Identity of a parsed source file: (resolved path, inode, device, size, mtime)
+FileKey = tuple[str, int, int, int, int]
+
+
+def _file_key(json_file: Path) -> FileKey:
+    """Get the identity of a config file's resolved target.
+    
+    Configs generated by NixOS are symlinks into the Nix store, where every
+    file has the same mtime, so the target path and inode are part of the key.
+    """
+    st = os.stat(json_file)
+    return os.path.realpath(json_file), st.st_ino, st.st_dev, st.st_size, st.st_mtime_ns
+
+
+class _CachedFile(BaseModel):
+    """A parsed configuration file stored in the registry cache."""
+    
+    key: FileKey
+    config: ServiceConfig
+
+
+class _RegistryCache(BaseModel):
+    """On-disk registry cache; plain JSON so loading it cannot run code."""
+    
+    version: str
+    fields: tuple[str, ...]
+    services_dir: str
+    parsed: dict[str, _CachedFile]
+
+
+def _load_one(json_file: Path) -> tuple[Path, ServiceConfig | Exception]:
+    """Parse one service configuration file, returning the error on failure."""
+    try:
+        # Parse and validate in one pass in pydantic-core
+        return json_file, ServiceConfig.model_validate_json(json_file.read_bytes())
+    except Exception as e:
+        return json_file, e
+
+
+def _default_cache_file() -> Path:
+    """Get the location of the parsed configuration cache."""
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "gameserver" / "registry.json"
+
 
 class ServiceRegistry:
     """Handles loading and managing game service configurations."""
     
-    def __init__(self, services_dir: Path | None = None) -> None:
+    def __init__(self, services_dir: Path | None = None, cache_file: Path | None = None) -> None:
         """Initialize the service registry.
         
         Args:
             services_dir: Directory containing service JSON files. 
                          Defaults to ~/games/services
+            cache_file: File used to cache parsed configurations between runs.
+                        Defaults to ~/.cache/gameserver/registry.json
         """
         if services_dir is None:
             services_dir = Path.home() / "games" / "services"
+        if cache_file is None:
+            cache_file = _default_cache_file()
         self.services_dir = services_dir
+        self.cache_file = cache_file
         self._configs: dict[str, ServiceConfig] = {}
+        # Parsed source files as path -> (file key, config)
+        self._parsed: dict[str, tuple[FileKey, ServiceConfig]] = {}
         self._load_configs()
     
-    def _load_configs(self) -> None:
-        """Load all service configurations from the services directory."""
+    def _load_configs(self, reuse: dict[str, tuple[FileKey, ServiceConfig]] | None = None) -> None:
+        """Load all service configurations from the services directory.
+        
+        Args:
+            reuse: Previously parsed files as path -> (file key, config). Files
+                   whose key is unchanged are not read again.
+                   Defaults to the contents of the cache file.
+        """
         self._configs.clear()
+        self._parsed = {}
         
         if not self.services_dir.exists():
             console.print(f"[yellow]Services directory not found: {self.services_dir}[/yellow]")
@@ -40,18 +102,91 @@ class ServiceRegistry:
             console.print(f"[yellow]No service configurations found in {self.services_dir}[/yellow]")
             return
         
+        if reuse is None:
+            reuse = self._load_cached()
+        
+        # Only files that are new or modified since they were parsed need reading
+        parsed: dict[str, tuple[FileKey, ServiceConfig]] = {}
+        stale = []
         for json_file in json_files:
+            path = str(json_file)
             try:
-                with open(json_file, 'r') as f:
-                    data = json.load(f)
-                config = ServiceConfig(**data)
-                self._configs[config.id] = config
-            except Exception as e:
+                key = _file_key(json_file)
+            except OSError as e:
+                # e.g. a dangling symlink after its store path was garbage collected
                 console.print(f"[red]Error loading {json_file}: {e}[/red]")
+                continue
+            previous = reuse.get(path)
+            if previous is not None and previous[0] == key:
+                parsed[path] = previous
+            else:
+                stale.append((json_file, key))
+        
+        changed = False
+        if stale:
+            # Read and validate files concurrently
+            with ThreadPoolExecutor(max_workers=min(8, len(stale))) as executor:
+                results = list(executor.map(_load_one, [json_file for json_file, _ in stale]))
+            
+            for (json_file, result), (_, key) in zip(results, stale, strict=True):
+                if isinstance(result, ServiceConfig):
+                    parsed[str(json_file)] = (key, result)
+                    changed = True
+                else:
+                    # Failed files stay stale so the error is reported again next time
+                    console.print(f"[red]Error loading {json_file}: {result}[/red]")
+        
+        # Merge in directory order so duplicate ids resolve consistently
+        self._parsed = parsed
+        for json_file in json_files:
+            entry = parsed.get(str(json_file))
+            if entry is not None:
+                config = entry[1]
+                self._configs[config.id] = config
+        
+        if changed or parsed.keys() != reuse.keys():
+            self._save_cache()
+    
+    def _load_cached(self) -> dict[str, tuple[FileKey, ServiceConfig]]:
+        """Load previously parsed configurations from the cache file.
+        
+        Returns:
+            Cached files as path -> (file key, config), or an empty dict if the
+            cache is missing, invalid or was written by another version
+        """
+        try:
+            cached = _RegistryCache.model_validate_json(self.cache_file.read_bytes())
+        except Exception:
+            return {}
+        if (cached.version != __version__ or
+                cached.fields != tuple(ServiceConfig.model_fields) or
+                cached.services_dir != str(self.services_dir)):
+            return {}
+        return {path: (entry.key, entry.config) for path, entry in cached.parsed.items()}
+    
+    def _save_cache(self) -> None:
+        """Write the parsed configurations to the cache file."""
+        payload = _RegistryCache(
+            version=__version__,
+            fields=tuple(ServiceConfig.model_fields),
+            services_dir=str(self.services_dir),
+            parsed={
+                path: _CachedFile(key=key, config=config)
+                for path, (key, config) in self._parsed.items()
+            },
+        )
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix(".tmp")
+            tmp_file.write_text(payload.model_dump_json(by_alias=True))
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            # Caching is best-effort
+            pass
     
     def reload(self) -> None:
-        """Reload all configurations from disk."""
-        self._load_configs()
+        """Reload configurations from disk, re-reading only changed files."""
+        self._load_configs(reuse=self._parsed)
     
     def get_config(self, game_id: str) -> ServiceConfig:
         """Get configuration for a specific game.
@@ -65,10 +200,24 @@ class ServiceRegistry:
         Raises:
             GameNotFoundError: If the game is not found
         """
-        if game_id not in self._configs:
+        config = self._configs.get(game_id)
+        if config is None:
             available = list(self._configs.keys())
             raise GameNotFoundError(game_id, available)
-        return self._configs[game_id]
+        return config
+    
+    def try_get(self, game_id: str) -> ServiceConfig | None:
+        """Get configuration for a game if it exists.
+        
+        Use this instead of ``has_game`` followed by ``get_config``.
+        
+        Args:
+            game_id: The game identifier
+            
+        Returns:
+            ServiceConfig for the game, or None if it is not found
+        """
+        return self._configs.get(game_id)
     
     def list_games(self) -> list[ServiceConfig]:
         """Get all available game configurations.
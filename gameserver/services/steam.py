@@ -1,39 +1,203 @@
 """SteamCMD operations for downloading and updating games."""
 
 import contextlib
-import json
+import functools
+import os
+import re
+import struct
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
 
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import (
+    BarColumn,
+    Progress,
+    SpinnerColumn,
+    TaskProgressColumn,
+    TextColumn,
+)
 
 from ..exceptions import SteamCMDError
 from ..models import DownloadMarker, ServiceConfig
 from .downloaders import BaseDownloader, register_downloader
+from .filesystem import format_size, walk_sizes
+from .validation import ValidationService
 
 console = Console()
 
+# Single-letter size labels used in the download marker (e.g. "1.5G")
+_MARKER_SIZE_UNITS = ('B', 'K', 'M', 'G', 'T', 'P')
+
+# Resolved loader in ldd output, e.g. "ld-linux-x86-64.so.2 => /nix/store/..."
+_LDD_INTERP_RE = re.compile(r"ld-linux-x86-64\.so\.2\s*=>\s*(\S+)")
+
+# SteamCMD status lines, e.g. "Update state (0x61) downloading, progress: 42.37 (...)"
+_STEAMCMD_PROGRESS_RE = re.compile(r"progress:\s*([\d.]+)")
+
+# ELF identification and header layout (see elf(5))
+ELF_MAGIC = b"\x7fELF"
+ELFCLASS64 = 2
+ELFDATA2LSB = 1
+EM_X86_64 = 62
+PT_INTERP = 3
+# Elf64_Ehdr fields: e_machine, e_phoff, then e_phentsize and e_phnum
+_ELF64_MACHINE = struct.Struct("<H")
+_ELF64_PHOFF = struct.Struct("<Q")
+_ELF64_PHNUM = struct.Struct("<HH")
+_ELF64_HEADER_SIZE = 64
+# Elf64_Phdr fields: p_type, (p_flags), p_offset, (p_vaddr, p_paddr), p_filesz
+_ELF64_PHDR = struct.Struct("<I4xQ16xQ")
+
+
+def _read_elf_interpreter(file_path: Path) -> str | None:
+    """Read the interpreter of a dynamically linked x86-64 ELF executable.
+    
+    Reads the ELF header and program headers directly and returns the
+    contents of the PT_INTERP segment, which is what patchelf's
+    --set-interpreter rewrites.
+    
+    Args:
+        file_path: File to inspect
+        
+    Returns:
+        The interpreter path, or None if the file is not a 64-bit
+        little-endian x86-64 ELF with an interpreter
+    """
+    try:
+        with open(file_path, "rb") as f:
+            header = f.read(_ELF64_HEADER_SIZE)
+            if (len(header) < _ELF64_HEADER_SIZE or
+                    header[:4] != ELF_MAGIC or
+                    header[4] != ELFCLASS64 or
+                    header[5] != ELFDATA2LSB or
+                    _ELF64_MACHINE.unpack_from(header, 18)[0] != EM_X86_64):
+                return None
+            
+            (phoff,) = _ELF64_PHOFF.unpack_from(header, 32)
+            phentsize, phnum = _ELF64_PHNUM.unpack_from(header, 54)
+            if phentsize < _ELF64_PHDR.size or phnum == 0:
+                return None
+            
+            f.seek(phoff)
+            program_headers = f.read(phentsize * phnum)
+            
+            for offset in range(0, len(program_headers) - _ELF64_PHDR.size + 1, phentsize):
+                p_type, p_offset, p_filesz = _ELF64_PHDR.unpack_from(program_headers, offset)
+                if p_type == PT_INTERP:
+                    f.seek(p_offset)
+                    interpreter = f.read(p_filesz).split(b"\0", 1)[0]
+                    return os.fsdecode(interpreter)
+    except OSError:
+        return None
+    return None
+
+
+def _find_store_interpreter(store_dir: str = "/nix/store") -> str | None:
+    """Find a glibc dynamic loader directly in the Nix store.
+    
+    Store entries are named ``<hash>-<name>``, so glibc outputs look like
+    ``<hash>-glibc-2.39-52``. Candidates are checked in sorted order for
+    determinism.
+    
+    Args:
+        store_dir: Nix store location
+        
+    Returns:
+        Path to ld-linux-x86-64.so.2, or None if none was found
+    """
+    try:
+        with os.scandir(store_dir) as entries:
+            candidates = sorted(
+                entry.path
+                for entry in entries
+                if entry.name.partition("-")[2].startswith("glibc-")
+                and entry.is_dir(follow_symlinks=False)
+            )
+    except OSError:
+        return None
+    
+    for glibc_dir in candidates:
+        potential_path = os.path.join(glibc_dir, "lib64", "ld-linux-x86-64.so.2")
+        if os.path.exists(potential_path):
+            return potential_path
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _discover_nix_interpreter() -> str | None:
+    """Find the dynamic loader that patched executables should use.
+    
+    The loader does not change while the process runs, so the lookup is done
+    once and reused for every file and every download.
+    
+    Returns:
+        Path to an existing ld-linux-x86-64.so.2, or None if none was found
+    """
+    # Find the correct glibc path by using ldd on /bin/ls (which is always available)
+    ldd_result = subprocess.run(
+        ["ldd", "/bin/ls"],
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    
+    interpreter_path = None
+    if ldd_result.returncode == 0:
+        # Take the path after '=>' on the ld-linux-x86-64.so.2 line
+        match = _LDD_INTERP_RE.search(ldd_result.stdout)
+        if match:
+            interpreter_path = match.group(1)
+    
+    # Fallback: try to find it directly in nix store
+    if not interpreter_path:
+        interpreter_path = _find_store_interpreter()
+    
+    if interpreter_path and os.path.exists(interpreter_path):
+        return interpreter_path
+    return None
+
+
+def _patch_interpreter(file_path: Path, interpreter_path: str) -> None:
+    """Point a dynamically linked x86-64 executable at the given interpreter.
+    
+    Args:
+        file_path: Executable to patch
+        interpreter_path: Dynamic loader to use
+    """
+    # Only dynamically linked executables not already using this loader need
+    # patching, so re-runs over a patched install fork no patchelf at all
+    current = _read_elf_interpreter(file_path)
+    if current is not None and current != interpreter_path:
+        # Try to patch the interpreter for NixOS
+        subprocess.run(
+            ["patchelf", "--set-interpreter", interpreter_path, str(file_path)],
+            capture_output=True,
+            check=False
+        )
+
 
 @register_downloader
 class SteamCMDService(BaseDownloader):
     """Handles SteamCMD operations for game downloads."""
     
+    source_type = "steam"
+    
     def can_handle(self, config: ServiceConfig) -> bool:
         """Check if this service can handle the given configuration."""
-        return config.game_source.type == "steam"
+        return config.game_source.type == self.source_type
     
     def needs_download(self, config: ServiceConfig, force: bool = False) -> bool:
         """Check if game needs to be downloaded."""
         if force:
             return True
         
-        marker_file = config.game_dir / ".steamcmd-completed"
-        if not marker_file.exists():
-            return True
+        marker_file = config.marker_file
         
         try:
+            # None when the marker is missing, so no separate exists() check
             marker = self._load_download_marker(marker_file)
             if not marker:
                 return True
@@ -49,18 +213,8 @@ class SteamCMDService(BaseDownloader):
     
     def validate_game_files(self, config: ServiceConfig) -> bool:
         """Validate that Steam game files are present and valid."""
-        if not config.executable.exists():
-            return False
-        
-        marker_file = config.game_dir / ".steamcmd-completed"
-        if not marker_file.exists():
-            return False
-        
-        try:
-            marker = self._load_download_marker(marker_file)
-            return marker is not None and marker.download_status == "success"
-        except Exception:
-            return False
+        # Same checks (and cached results) as the CLI's pre-start validation
+        return ValidationService.validate_many([config])[config.id] is None
     
     @staticmethod
     def build_steamcmd_command(config: ServiceConfig, app_id: str, beta_branch: str, beta_password: str) -> list[str]:
@@ -99,57 +253,22 @@ class SteamCMDService(BaseDownloader):
             game_dir: Game installation directory
         """
         try:
-            # Find the correct glibc path by using ldd on /bin/ls (which is always available)
-            ldd_result = subprocess.run(
-                ["ldd", "/bin/ls"],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            
-            interpreter_path = None
-            if ldd_result.returncode == 0:
-                # Look for the ld-linux-x86-64.so.2 line in ldd output
-                for line in ldd_result.stdout.split('\n'):
-                    if 'ld-linux-x86-64.so.2' in line and '=>' in line:
-                        # Extract the path after '=>'
-                        interpreter_path = line.split('=>')[1].strip().split()[0]
-                        break
-            
-            # Fallback: try to find it directly in nix store
-            if not interpreter_path:
-                find_result = subprocess.run(
-                    ["find", "/nix/store", "-maxdepth", "2", "-name", "glibc-*"],
-                    capture_output=True,
-                    text=True,
-                    check=False
-                )
-                if find_result.returncode == 0 and find_result.stdout.strip():
-                    glibc_dir = find_result.stdout.strip().split('\n')[0]
-                    potential_path = f"{glibc_dir}/lib64/ld-linux-x86-64.so.2"
-                    if Path(potential_path).exists():
-                        interpreter_path = potential_path
+            interpreter_path = _discover_nix_interpreter()
             
-            if interpreter_path and Path(interpreter_path).exists():
+            if interpreter_path:
+                candidates = []
                 for file_path in game_dir.rglob("*"):
-                    if file_path.is_file() and file_path.stat().st_mode & 0o111:
-                        # Check if it's an ELF executable that needs patching
-                        file_result = subprocess.run(
-                            ["file", str(file_path)],
-                            capture_output=True,
-                            text=True,
-                            check=False
-                        )
-                        
-                        if ("ELF" in file_result.stdout and 
-                            "dynamically linked" in file_result.stdout and
-                            "x86-64" in file_result.stdout):
-                            # Try to patch the interpreter for NixOS
-                            subprocess.run(
-                                ["patchelf", "--set-interpreter", interpreter_path, str(file_path)],
-                                capture_output=True,
-                                check=False
-                            )
+                    if not file_path.is_file():
+                        continue
+                    file_stat = file_path.stat()
+                    # Too small to hold an ELF header, or not executable
+                    if file_stat.st_size < _ELF64_HEADER_SIZE or not file_stat.st_mode & 0o111:
+                        continue
+                    candidates.append(file_path)
+                
+                # Header reads and patchelf runs release the GIL, so threads scale
+                with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    list(executor.map(_patch_interpreter, candidates, repeat(interpreter_path)))
         except Exception:
             # Patchelf might fail on some files, that's okay
             pass
@@ -187,7 +306,7 @@ class SteamCMDService(BaseDownloader):
         config.game_dir.mkdir(parents=True, exist_ok=True)
         
         # Remove old marker to indicate download in progress
-        marker_file = config.game_dir / ".steamcmd-completed"
+        marker_file = config.marker_file
         if marker_file.exists():
             marker_file.unlink()
         
@@ -200,26 +319,39 @@ class SteamCMDService(BaseDownloader):
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
             console=console
         ) as progress:
             task = progress.add_task("Downloading game files...", total=None)
             
-            try:
-                subprocess.run(
-                    cmd,
-                    cwd=config.game_dir,
-                    check=True,
-                    capture_output=False  # Show output in real time
-                )
-                
-                progress.update(task, description="[green]Download completed successfully[/green]")
-                
-            except subprocess.CalledProcessError as e:
+            # Stream output so the bar can follow SteamCMD's own progress reports
+            with subprocess.Popen(
+                cmd,
+                cwd=config.game_dir,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                errors="replace",
+                bufsize=1
+            ) as process:
+                output = process.stdout
+                assert output is not None  # stdout=PIPE
+                for line in output:
+                    line = line.rstrip()
+                    progress.console.print(line, markup=False, highlight=False)
+                    match = _STEAMCMD_PROGRESS_RE.search(line)
+                    if match:
+                        progress.update(task, completed=float(match.group(1)), total=100)
+            
+            if process.returncode != 0:
                 progress.update(task, description="[red]Download failed[/red]")
                 raise SteamCMDError(
-                    f"SteamCMD failed with exit code {e.returncode}",
+                    f"SteamCMD failed with exit code {process.returncode}",
                     "Check your internet connection and Steam app ID"
-                ) from e
+                )
+            
+            progress.update(task, description="[green]Download completed successfully[/green]")
         
         console.print("=" * 50)
         console.print("[green]✓ Download completed successfully[/green]")
@@ -239,22 +371,16 @@ class SteamCMDService(BaseDownloader):
         file_count = 0
         total_size_bytes = 0
         
-        if config.game_dir.exists():
-            for file_path in config.game_dir.rglob("*"):
-                if file_path.is_file():
-                    file_count += 1
-                    with contextlib.suppress(OSError):
-                        total_size_bytes += file_path.stat().st_size
+        with contextlib.suppress(OSError):
+            file_count, total_size_bytes = walk_sizes(config.game_dir)
         
-        # Format size in human-readable format
-        def format_size(size_bytes: int) -> str:
-            for unit in ['B', 'K', 'M', 'G', 'T']:
-                if size_bytes < 1024:
-                    return f"{size_bytes:.1f}{unit}"
-                size_bytes /= 1024
-            return f"{size_bytes:.1f}P"
+        total_size = format_size(total_size_bytes, _MARKER_SIZE_UNITS)
         
-        total_size = format_size(total_size_bytes)
+        # Recorded so validation can detect a replaced or truncated executable
+        # with one stat instead of walking the install
+        executable_size = None
+        with contextlib.suppress(OSError):
+            executable_size = config.executable.stat().st_size
         
         # Create marker data
         now = datetime.now()
@@ -266,10 +392,11 @@ class SteamCMDService(BaseDownloader):
             file_count=file_count,
             total_size=total_size,
             validation_status="passed",
-            last_updated=now
+            last_updated=now,
+            executable_size=executable_size
         )
         
         # Write marker file
-        marker_file = config.game_dir / ".steamcmd-completed"
-        with open(marker_file, 'w') as f:
-            json.dump(marker.model_dump(), f, indent=2, default=str)
+        marker_file = config.marker_file
+        marker_file.write_text(marker.model_dump_json(indent=2))
+        ValidationService.invalidate(marker_file)
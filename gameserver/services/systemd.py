@@ -1,5 +1,6 @@
 """systemd service management for game servers."""
 
+import os
 import subprocess
 
 from rich.console import Console
@@ -9,29 +10,65 @@ from ..models import ServiceConfig
 
 console = Console()
 
+# Prefix for commands that need root; empty when already running as root so
+# each call skips the sudo fork and PAM session setup
+_SUDO = [] if os.geteuid() == 0 else ["sudo"]
+
 
 class SystemdService:
     """Handles systemd service operations for game servers."""
     
     @staticmethod
-    def is_active(unit_name: str) -> bool:
-        """Check if a systemd unit is active.
+    def query_states(unit_names: list[str]) -> dict[str, dict[str, str]]:
+        """Query the ActiveState and LoadState of several units in one call.
         
         Args:
-            unit_name: The systemd unit name
+            unit_names: The systemd unit names
             
         Returns:
-            True if the service is active
+            Mapping of unit name to its properties (e.g. {"ActiveState": "active"}).
+            Units are missing from the result if systemctl could not be queried.
         """
+        if not unit_names:
+            return {}
+        
         try:
             result = subprocess.run(
-                ["sudo", "systemctl", "is-active", "--quiet", unit_name],
+                # Reading unit properties needs no privileges, so no sudo here
+                ["systemctl", "show",
+                 "--property=ActiveState", "--property=LoadState",
+                 "--", *unit_names],
                 capture_output=True,
+                text=True,
                 check=False
             )
-            return result.returncode == 0
         except Exception:
-            return False
+            return {}
+        if result.returncode != 0:
+            return {}
+        
+        # One blank-line separated block of key=value lines per unit, in argument order
+        records = [
+            dict(line.split("=", 1) for line in block.splitlines() if "=" in line)
+            for block in result.stdout.strip().split("\n\n")
+        ]
+        if len(records) != len(unit_names):
+            return {}
+        return dict(zip(unit_names, records, strict=True))
+    
+    @staticmethod
+    def is_active(unit_name: str) -> bool:
+        """Check if a systemd unit is active.
+        
+        Args:
+            unit_name: The systemd unit name
+            
+        Returns:
+            True if the service is active
+        """
+        state = SystemdService.query_states([unit_name]).get(unit_name, {})
+        # Same states `systemctl is-active` reports success for
+        return state.get("ActiveState") in ("active", "reloading")
     
     @staticmethod
     def is_managed(unit_name: str) -> bool:
@@ -41,18 +78,17 @@ class SystemdService:
             unit_name: The systemd unit name
             
         Returns:
-            True if the service exists (in any state: active, activating, failed, etc.)
+            True if the service exists (in any state: active, activating, failed, etc.),
+            or if systemd could not be queried
         """
-        try:
-            result = subprocess.run(
-                ["sudo", "systemctl", "status", unit_name],
-                capture_output=True,
-                check=False
-            )
-            # Return code 0 = active, 1 = dead, 3 = failed/activating, 4 = not found
-            return result.returncode != 4
-        except Exception:
-            return False
+        # LoadState is "not-found" for units systemd does not know about; unlike
+        # `systemctl status` this does not render the journal or cgroup tree
+        state = SystemdService.query_states([unit_name]).get(unit_name)
+        if state is None:
+            # A failed query is not proof the unit is gone; let callers try
+            # the operation and surface its error
+            return True
+        return state.get("LoadState") != "not-found"
     
     @staticmethod
     def get_status(unit_name: str) -> str:
@@ -64,16 +100,32 @@ class SystemdService:
         Returns:
             Status string (active, inactive, failed, etc.)
         """
-        try:
-            result = subprocess.run(
-                ["sudo", "systemctl", "is-active", unit_name],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            return result.stdout.strip() or "inactive"
-        except Exception:
+        state = SystemdService.query_states([unit_name]).get(unit_name)
+        if state is None:
             return "unknown"
+        return state.get("ActiveState") or "inactive"
+    
+    @staticmethod
+    def get_status_many(unit_names: list[str]) -> dict[str, str]:
+        """Get the status of several systemd units with a single systemctl call.
+        
+        Args:
+            unit_names: The systemd unit names
+            
+        Returns:
+            Mapping of unit name to status string (active, inactive, failed, etc.)
+        """
+        states = SystemdService.query_states(unit_names)
+        
+        statuses = {}
+        for name in unit_names:
+            state = states.get(name)
+            if state is None:
+                # Batch query failed (e.g. one invalid unit name); ask individually
+                statuses[name] = SystemdService.get_status(name)
+            else:
+                statuses[name] = state.get("ActiveState") or "inactive"
+        return statuses
     
     @staticmethod
     def start_service(config: ServiceConfig) -> None:
@@ -90,7 +142,7 @@ class SystemdService:
         
         # Build systemd-run command
         cmd = [
-            "sudo", "systemd-run",
+            *_SUDO, "systemd-run",
             f"--unit={config.unit_name}",
             f"--uid={config.user}",
             f"--gid={config.group}",
@@ -163,7 +215,7 @@ class SystemdService:
         # Use systemctl stop (either as fallback or primary method)
         try:
             subprocess.run(
-                ["sudo", "systemctl", "stop", config.unit_name],
+                [*_SUDO, "systemctl", "stop", config.unit_name],
                 capture_output=True,
                 text=True,
                 check=True
@@ -183,7 +235,13 @@ class SystemdService:
         console.print(f"Restarting {config.name}...")
         SystemdService.stop_service(config)
         import time
-        time.sleep(2)
+        # systemd-run cannot reuse the unit name until the stopped transient unit
+        # has been garbage collected, so wait for it to disappear, backing off to
+        # roughly the old fixed 2s wait
+        for delay in (0.05, 0.1, 0.2, 0.4, 0.8, 1.6):
+            if not SystemdService.is_managed(config.unit_name):
+                break
+            time.sleep(delay)
         SystemdService.start_service(config)
     
     @staticmethod
@@ -197,7 +255,7 @@ class SystemdService:
         if args is None:
             args = ["--no-pager", "-n", "50"]
         
-        cmd = ["sudo", "journalctl", "-u", unit_name] + args
+        cmd = [*_SUDO, "journalctl", "-u", unit_name] + args
         
         try:
             subprocess.run(cmd, check=True)
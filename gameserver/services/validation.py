@@ -1,14 +1,175 @@
 """File and download validation services."""
 
-import json
+import errno
+import os
+import stat
+import time
+from collections.abc import Iterable
 from pathlib import Path
 
-from rich.console import Console
-
 from ..exceptions import ValidationError
 from ..models import DownloadMarker, ServiceConfig, GameSource
 
-console = Console()
+# Parsed download markers as path -> ((mtime, size), marker), oldest first
+_MARKER_CACHE: dict[str, tuple[tuple[int, int], DownloadMarker]] = {}
+_MARKER_CACHE_SIZE = 128
+
+# Markers are a few hundred bytes; anything this large is not one of ours
+_MAX_MARKER_BYTES = 64 * 1024
+
+# Validation outcomes keyed by everything they depend on, oldest first
+_RESULT_CACHE: dict[tuple, ValidationError | None] = {}
+_RESULT_CACHE_SIZE = 256
+
+# Marker paths found missing as path -> monotonic time of the failed stat
+_MISSING: dict[str, float] = {}
+_MISSING_TTL = 1.0
+
+
+# Errors Path.exists() treats as "does not exist"
+_MISSING_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP})
+
+
+def _stat_or_none(path: str | Path) -> os.stat_result | None:
+    """Stat a path, returning None if it does not exist.
+    
+    Like ``Path.exists()``, a path below a regular file or a symlink loop
+    counts as missing rather than raising.
+    """
+    try:
+        return os.stat(path)
+    except OSError as e:
+        if e.errno in _MISSING_ERRNOS:
+            return None
+        raise
+
+
+def _stat_marker(marker_file: Path) -> os.stat_result | None:
+    """Stat a download marker, remembering recent misses for a short time.
+    
+    Args:
+        marker_file: Path to the marker file
+        
+    Returns:
+        The stat result, or None if the marker does not exist
+    """
+    key = os.fspath(marker_file)
+    missing_since = _MISSING.get(key)
+    if missing_since is not None and time.monotonic() - missing_since < _MISSING_TTL:
+        return None
+    
+    st = _stat_or_none(key)
+    if st is None:
+        _MISSING[key] = time.monotonic()
+    elif missing_since is not None:
+        del _MISSING[key]
+    return st
+
+
+def _parse_marker(marker_file: Path, st: os.stat_result) -> DownloadMarker:
+    """Parse a download marker that is known to exist.
+    
+    Args:
+        marker_file: Path to the marker file
+        st: Result of stat on the marker file
+        
+    Returns:
+        The parsed marker, reused from the cache while the file is unchanged
+        
+    Raises:
+        ValidationError: If marker file is invalid
+    """
+    # Reuse the parsed marker while the file is unchanged
+    key = os.fspath(marker_file)
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _MARKER_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    
+    if st.st_size > _MAX_MARKER_BYTES:
+        raise ValidationError(
+            f"Download marker file is implausibly large ({st.st_size} bytes): {marker_file}",
+            "Run 'gameserver update <game>' to repair"
+        )
+    
+    try:
+        # Parse and validate in one pass in pydantic-core
+        marker = DownloadMarker.model_validate_json(marker_file.read_bytes())
+    except ValueError as e:
+        raise ValidationError(
+            f"Invalid download marker file: {marker_file}",
+            "Run 'gameserver update <game>' to repair"
+        ) from e
+    
+    _MARKER_CACHE.pop(key, None)
+    if len(_MARKER_CACHE) >= _MARKER_CACHE_SIZE:
+        del _MARKER_CACHE[next(iter(_MARKER_CACHE))]
+    _MARKER_CACHE[key] = (signature, marker)
+    return marker
+
+
+def _check_game_files(
+    config: ServiceConfig,
+    executable_st: os.stat_result | None,
+    marker_st: os.stat_result | None
+) -> None:
+    """Validate one configuration's game files from already gathered stats.
+    
+    Args:
+        config: The service configuration
+        executable_st: Stat result of the executable, or None if missing
+        marker_st: Stat result of the download marker, or None if missing
+        
+    Raises:
+        ValidationError: If validation fails
+    """
+    # One stat answers existence, file type and size
+    if executable_st is None:
+        raise ValidationError(
+            f"Game executable not found: {config.executable}",
+            f"Run 'gameserver update {config.id}' to download files"
+        )
+    
+    # Check if executable is actually executable
+    if not stat.S_ISREG(executable_st.st_mode):
+        raise ValidationError(
+            f"Executable path is not a file: {config.executable}"
+        )
+    
+    # If steam game is configured, validate download marker
+    source = config.game_source
+    if source.type == "steam":
+        marker_file = config.marker_file
+        marker = None if marker_st is None else _parse_marker(marker_file, marker_st)
+        
+        if marker is None:
+            raise ValidationError(
+                "Game files not found",
+                f"Run 'gameserver update {config.id}' first"
+            )
+        
+        if marker.download_status != "success":
+            raise ValidationError(
+                "Previous download failed",
+                f"Run 'gameserver update {config.id}' to retry"
+            )
+        
+        # Validate that the game source matches
+        marker_source = marker.game_source
+        if marker_source.key != source.key:
+            raise ValidationError(
+                f"Game source mismatch: expected {source.type}:{source.source_id}, "
+                f"got {marker_source.type}:{marker_source.source_id}",
+                f"Run 'gameserver update {config.id}' to update"
+            )
+        
+        # Markers written before the size was recorded have None here
+        if (marker.executable_size is not None and
+                marker.executable_size != executable_st.st_size):
+            raise ValidationError(
+                f"Game executable has changed since download: {config.executable}",
+                f"Run 'gameserver update {config.id}' to repair"
+            )
 
 
 class ValidationService:
@@ -27,18 +188,22 @@ class ValidationService:
         Raises:
             ValidationError: If marker file is invalid
         """
-        if not marker_file.exists():
+        st = _stat_marker(marker_file)
+        if st is None:
             return None
         
-        try:
-            with open(marker_file, 'r') as f:
-                data = json.load(f)
-            return DownloadMarker(**data)
-        except (json.JSONDecodeError, ValueError) as e:
-            raise ValidationError(
-                f"Invalid download marker file: {marker_file}",
-                "Run 'gameserver update <game>' to repair"
-            ) from e
+        return _parse_marker(marker_file, st)
+    
+    @staticmethod
+    def invalidate(marker_file: Path) -> None:
+        """Forget cached state for a marker file (e.g. after writing it).
+        
+        Args:
+            marker_file: Path to the marker file
+        """
+        key = os.fspath(marker_file)
+        _MISSING.pop(key, None)
+        _MARKER_CACHE.pop(key, None)
     
     @staticmethod
     def validate_game_files(config: ServiceConfig) -> None:
@@ -50,44 +215,77 @@ class ValidationService:
         Raises:
             ValidationError: If validation fails
         """
-        # Check if executable exists
-        if not config.executable.exists():
-            raise ValidationError(
-                f"Game executable not found: {config.executable}",
-                f"Run 'gameserver update {config.id}' to download files"
-            )
+        error = ValidationService.validate_many([config])[config.id]
+        if error is not None:
+            # Cached errors are raised again; drop the previous traceback
+            raise error.with_traceback(None)
+    
+    @staticmethod
+    def validate_many(configs: Iterable[ServiceConfig]) -> dict[str, ValidationError | None]:
+        """Validate the game files of several configurations.
         
-        # Check if executable is actually executable
-        if not config.executable.is_file():
-            raise ValidationError(
-                f"Executable path is not a file: {config.executable}"
-            )
+        Each distinct path is stat'ed at most once, so configurations that
+        share an install directory or executable do not repeat the lookups.
+        Outcomes are remembered until the files involved change, so repeated
+        validation of an unchanged install only costs the stats.
+        
+        Args:
+            configs: The service configurations
+            
+        Returns:
+            Mapping of game ID to the validation error, or None if valid
+        """
+        stats: dict[str, os.stat_result | None] = {}
+        
+        def stat_of(path: Path) -> os.stat_result | None:
+            # Convert once; stat on a str skips the Path -> str round trip
+            key = os.fspath(path)
+            if key not in stats:
+                stats[key] = _stat_or_none(key)
+            return stats[key]
         
-        # If steam game is configured, validate download marker
-        if config.game_source.type == "steam":
-            marker_file = config.game_dir / ".steamcmd-completed"
-            marker = ValidationService.validate_download_marker(marker_file)
+        results: dict[str, ValidationError | None] = {}
+        for config in configs:
+            executable_st = stat_of(config.executable)
+            marker_file = config.marker_file
+            marker_st = None
+            if config.game_source.type == "steam":
+                marker_st = _stat_marker(marker_file)
             
-            if marker is None:
-                raise ValidationError(
-                    "Game files not found",
-                    f"Run 'gameserver update {config.id}' first"
-                )
+            key = (
+                config.id,
+                os.fspath(config.executable),
+                os.fspath(marker_file),
+                config.game_source.key,
+                None if executable_st is None else (
+                    stat.S_ISREG(executable_st.st_mode), executable_st.st_size
+                ),
+                None if marker_st is None else (marker_st.st_mtime_ns, marker_st.st_size),
+            )
+            if key in _RESULT_CACHE:
+                results[config.id] = _RESULT_CACHE[key]
+                continue
             
-            if marker.download_status != "success":
-                raise ValidationError(
-                    "Previous download failed",
-                    f"Run 'gameserver update {config.id}' to retry"
-                )
+            try:
+                _check_game_files(config, executable_st, marker_st)
+                error = None
+            except ValidationError as e:
+                error = e
             
-            # Validate that the game source matches
-            if (marker.game_source.type != config.game_source.type or 
-                marker.game_source.source_id != config.game_source.source_id):
-                raise ValidationError(
-                    f"Game source mismatch: expected {config.game_source.type}:{config.game_source.source_id}, "
-                    f"got {marker.game_source.type}:{marker.game_source.source_id}",
-                    f"Run 'gameserver update {config.id}' to update"
-                )
+            if len(_RESULT_CACHE) >= _RESULT_CACHE_SIZE:
+                del _RESULT_CACHE[next(iter(_RESULT_CACHE))]
+            _RESULT_CACHE[key] = results[config.id] = error
+        return results
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget all cached markers and validation results.
+        
+        Call after operations that change game files (update, clean).
+        """
+        _MARKER_CACHE.clear()
+        _MISSING.clear()
+        _RESULT_CACHE.clear()
     
     @staticmethod
     def needs_download(marker_file: Path, game_source: "GameSource", force: bool = False) -> bool:
@@ -105,16 +303,19 @@ class ValidationService:
             return True
         
         try:
-            marker = ValidationService.validate_download_marker(marker_file)
-            if marker is None:
+            # A missing marker means a download, without going near the parser
+            st = _stat_marker(marker_file)
+            if st is None:
                 return True
             
+            marker = _parse_marker(marker_file, st)
+            
             # Check if it's the same game source
-            if (marker.game_source.type != game_source.type or
-                marker.game_source.source_id != game_source.source_id):
+            if marker.game_source.key != game_source.key:
                 return True
             
             # Check if download was successful
             return marker.download_status != "success"
-        except ValidationError:
+        except (ValidationError, OSError):
+            # Unreadable markers are treated like missing ones
             return True
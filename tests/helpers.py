@@ -0,0 +1,30 @@
+"""Shared helpers for the test suite."""
+
+import os
+from pathlib import Path
+
+from gameserver.models import GameSource, ServiceConfig
+
+
+def make_config(
+    source_type: str = "steam",
+    source_id: str = "294420",
+    game_dir: Path = Path("/games/test"),
+) -> ServiceConfig:
+    """Build a minimal service configuration rooted at game_dir."""
+    return ServiceConfig(
+        id="test-game",
+        name="Test Game",
+        description="A test game",
+        unit_name="test-game",
+        game_source=GameSource(type=source_type, source_id=source_id),
+        game_dir=game_dir,
+        executable=game_dir / "server",
+        user="gameserver"
+    )
+
+
+def bump_mtime(path: Path) -> None:
+    """Move a file's mtime one second forward so stat-keyed caches see a change."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
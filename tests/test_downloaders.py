@@ -0,0 +1,75 @@
+"""Tests for downloader dispatch and download markers."""
+
+import pytest
+
+from gameserver.exceptions import GameServerError
+from gameserver.models import ServiceConfig
+from gameserver.services.downloaders import DownloadManager
+from gameserver.services.steam import SteamCMDService
+from tests.helpers import bump_mtime, make_config
+
+
+class TestDownloadManager:
+    """Test downloader selection."""
+    
+    def test_steam_downloader_is_reused(self):
+        """Test that repeated lookups return the same downloader instance."""
+        manager = DownloadManager()
+        
+        first = manager.get_downloader(make_config("steam"))
+        second = manager.get_downloader(make_config("steam", "380870"))
+        
+        assert isinstance(first, SteamCMDService)
+        assert first is second
+        # Instances are shared between managers as well
+        assert DownloadManager().get_downloader(make_config("steam")) is first
+    
+    def test_unsupported_source(self):
+        """Test that an unsupported source type raises."""
+        with pytest.raises(GameServerError):
+            DownloadManager().get_downloader(make_config("manual", "x"))
+    
+    def test_manual_registration_takes_priority(self):
+        """Test that registering a downloader replaces cached resolutions."""
+        manager = DownloadManager()
+        manager.get_downloader(make_config("steam"))
+        
+        custom = SteamCMDService()
+        manager.register_downloader(custom)
+        
+        assert manager.get_downloader(make_config("steam")) is custom
+    
+    def test_cache_respects_source_id(self):
+        """Test that a downloader limited to one source ID is not reused for another."""
+        class OnlyOne(SteamCMDService):
+            def can_handle(self, config: ServiceConfig) -> bool:
+                return config.game_source.source_id == "1"
+        
+        manager = DownloadManager()
+        only_one = OnlyOne()
+        manager.register_downloader(only_one)
+        
+        assert manager.get_downloader(make_config("steam", "1")) is only_one
+        assert manager.get_downloader(make_config("steam", "2")) is not only_one
+        assert manager.get_downloader(make_config("steam", "1")) is only_one
+
+
+class TestDownloadMarker:
+    """Test download marker loading."""
+    
+    def test_marker_reused_until_modified(self, tmp_path):
+        """Test that an unchanged marker file is parsed only once."""
+        config = make_config(game_dir=tmp_path)
+        service = SteamCMDService()
+        service._create_download_marker(config)
+        marker_file = tmp_path / ".steamcmd-completed"
+        
+        first = service._load_download_marker(marker_file)
+        assert first is not None
+        assert service._load_download_marker(marker_file) is first
+        
+        bump_mtime(marker_file)
+        assert service._load_download_marker(marker_file) is not first
+        
+        marker_file.unlink()
+        assert service._load_download_marker(marker_file) is None
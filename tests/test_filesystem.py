@@ -0,0 +1,51 @@
+"""Tests for filesystem helpers."""
+
+import pytest
+
+from gameserver.services.filesystem import dir_size_bytes, format_size, walk_sizes
+
+
+class TestWalkSizes:
+    """Test directory size accounting."""
+    
+    def test_counts_nested_files(self, tmp_path):
+        """Test that files in nested directories are counted once."""
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "top.bin").write_bytes(b"x" * 10)
+        (tmp_path / "a" / "mid.bin").write_bytes(b"x" * 20)
+        (tmp_path / "a" / "b" / "deep.bin").write_bytes(b"x" * 30)
+        # Symlinks are neither followed nor counted
+        (tmp_path / "link").symlink_to(tmp_path / "a")
+        
+        assert walk_sizes(tmp_path) == (3, 60)
+        assert dir_size_bytes(tmp_path) == 60
+    
+    def test_missing_directory(self, tmp_path):
+        """Test that a missing top-level directory raises."""
+        with pytest.raises(OSError):
+            walk_sizes(tmp_path / "missing")
+
+
+class TestFormatSize:
+    """Test human-readable size formatting."""
+    
+    def test_unit_boundaries(self):
+        """Test sizes on either side of each unit boundary."""
+        assert format_size(0) == "0.0B"
+        assert format_size(1023) == "1023.0B"
+        assert format_size(1024) == "1.0KB"
+        assert format_size(1536) == "1.5KB"
+        assert format_size(1024 ** 3) == "1.0GB"
+    
+    def test_caps_at_largest_unit(self):
+        """Test that sizes beyond petabytes stay in PB."""
+        assert format_size(1024 ** 5) == "1.0PB"
+        assert format_size(1024 ** 6) == "1024.0PB"
+    
+    def test_custom_units(self):
+        """Test the single-letter labels used in download markers."""
+        units = ('B', 'K', 'M', 'G', 'T', 'P')
+        assert format_size(0, units) == "0.0B"
+        assert format_size(1536, units) == "1.5K"
+        assert format_size(5 * 1024 ** 3, units) == "5.0G"
+        assert format_size(1024 ** 6, units) == "1024.0P"
@@ -0,0 +1,60 @@
+"""Tests for network port inspection."""
+
+import socket
+import subprocess
+
+import pytest
+
+from gameserver.services import network
+from gameserver.services.netlink_ports import list_listening_ports
+
+SS_OUTPUT = """\
+Netid State  Recv-Q Send-Q Local Address:Port  Peer Address:Port Process
+udp   UNCONN 0      0            0.0.0.0:26900      0.0.0.0:*
+tcp   LISTEN 0      128          0.0.0.0:26900      0.0.0.0:*
+tcp   LISTEN 0      128             [::]:22            [::]:*
+udp   UNCONN 0      0      127.0.0.53%lo:53         0.0.0.0:*
+"""
+
+
+class TestListeningPorts:
+    """Test listening port lookup."""
+
+    def test_parses_ss_output(self, monkeypatch):
+        """Test extracting local ports from ss output."""
+        calls = []
+
+        def no_netlink():
+            raise OSError("netlink unavailable")
+
+        def fake_run(cmd, **_kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, stdout=SS_OUTPUT, stderr="")
+
+        monkeypatch.setattr(network, "list_listening_ports", no_netlink)
+        monkeypatch.setattr(network.subprocess, "run", fake_run)
+        network.invalidate_ports_cache()
+
+        assert network.get_listening_ports() == {22, 53, 26900}
+        # A second lookup within the TTL reuses the cached result
+        assert network.get_listening_ports() == {22, 53, 26900}
+        assert len(calls) == 1
+
+        network.invalidate_ports_cache()
+        assert network.get_listening() == ({22, 53, 26900}, {26900})
+        assert len(calls) == 2
+        network.invalidate_ports_cache()
+
+    def test_netlink_sees_bound_sockets(self):
+        """Test that netlink enumeration reports TCP and UDP listeners."""
+        with socket.socket() as tcp, socket.socket(type=socket.SOCK_DGRAM) as udp:
+            tcp.bind(("127.0.0.1", 0))
+            tcp.listen()
+            udp.bind(("127.0.0.1", 0))
+            try:
+                ports = list_listening_ports()
+            except (OSError, AttributeError):
+                pytest.skip("netlink sock_diag not available")
+
+            assert tcp.getsockname()[1] in ports
+            assert udp.getsockname()[1] in ports
@@ -0,0 +1,152 @@
+"""Tests for the service registry."""
+
+import json
+import os
+
+from gameserver.services.registry import ServiceRegistry
+from tests.helpers import bump_mtime
+
+
+def write_config(path, game_id, name):
+    """Write a minimal service configuration file."""
+    path.write_text(json.dumps({
+        "id": game_id,
+        "name": name,
+        "description": "A test game",
+        "unitName": f"game-{game_id}",
+        "game_source": {"type": "steam", "source_id": "294420"},
+        "gameDir": f"/games/{game_id}",
+        "executable": f"/games/{game_id}/server",
+        "user": "gameserver",
+    }))
+
+
+class TestServiceRegistry:
+    """Test service registry functionality."""
+    
+    def test_load_configs(self, tmp_path):
+        """Test loading configurations from the services directory."""
+        services_dir = tmp_path / "services"
+        services_dir.mkdir()
+        write_config(services_dir / "test.json", "test-game", "Test Game")
+        
+        registry = ServiceRegistry(services_dir, cache_file=tmp_path / "cache.json")
+        
+        assert registry.get_game_ids() == ["test-game"]
+        assert registry.get_config("test-game").name == "Test Game"
+        assert registry.try_get("test-game") is registry.get_config("test-game")
+        assert registry.try_get("missing") is None
+    
+    def test_dangling_symlink_skipped(self, tmp_path):
+        """Test that a config symlink with a missing target is reported and skipped."""
+        services_dir = tmp_path / "services"
+        services_dir.mkdir()
+        write_config(services_dir / "test.json", "test-game", "Test Game")
+        (services_dir / "broken.json").symlink_to(tmp_path / "nowhere.json")
+        
+        registry = ServiceRegistry(services_dir, cache_file=tmp_path / "cache.json")
+        
+        assert registry.get_game_ids() == ["test-game"]
+    
+    def test_cache_reused_and_invalidated(self, tmp_path):
+        """Test that the parsed config cache is reused until a source changes."""
+        services_dir = tmp_path / "services"
+        services_dir.mkdir()
+        config_file = services_dir / "test.json"
+        cache_file = tmp_path / "cache.json"
+        write_config(config_file, "test-game", "Test Game")
+        
+        ServiceRegistry(services_dir, cache_file=cache_file)
+        assert cache_file.exists()
+        
+        # A warm load returns the same configuration
+        registry = ServiceRegistry(services_dir, cache_file=cache_file)
+        assert registry.get_config("test-game").name == "Test Game"
+        
+        # Changing a source file invalidates the cache
+        write_config(config_file, "test-game", "Renamed Game")
+        bump_mtime(config_file)
+        registry = ServiceRegistry(services_dir, cache_file=cache_file)
+        assert registry.get_config("test-game").name == "Renamed Game"
+        
+        # Removing a source file invalidates the cache
+        config_file.unlink()
+        write_config(services_dir / "other.json", "other-game", "Other Game")
+        registry = ServiceRegistry(services_dir, cache_file=cache_file)
+        assert registry.get_game_ids() == ["other-game"]
+    
+    def test_cache_follows_symlink_target_with_same_mtime(self, tmp_path):
+        """Test that repointing a config symlink invalidates the cache even if mtimes match."""
+        services_dir = tmp_path / "services"
+        services_dir.mkdir()
+        store = tmp_path / "store"
+        store.mkdir()
+        cache_file = tmp_path / "cache.json"
+        
+        # Store files all share one mtime, as in /nix/store
+        old_target = store / "old-game.json"
+        new_target = store / "new-game.json"
+        write_config(old_target, "test-game", "Test Game")
+        write_config(new_target, "test-game", "Test Game v2")
+        os.utime(old_target, ns=(1_000_000_000, 1_000_000_000))
+        os.utime(new_target, ns=(1_000_000_000, 1_000_000_000))
+        
+        link = services_dir / "test.json"
+        link.symlink_to(old_target)
+        ServiceRegistry(services_dir, cache_file=cache_file)
+        json.loads(cache_file.read_text())
+        
+        link.unlink()
+        link.symlink_to(new_target)
+        registry = ServiceRegistry(services_dir, cache_file=cache_file)
+        assert registry.get_config("test-game").name == "Test Game v2"
+    
+    def test_reload_reparses_only_changed_files(self, tmp_path, monkeypatch):
+        """Test that reload keeps configs of unchanged files without re-reading them."""
+        from gameserver.services import registry as registry_module
+        
+        services_dir = tmp_path / "services"
+        services_dir.mkdir()
+        write_config(services_dir / "a.json", "game-a", "Game A")
+        write_config(services_dir / "b.json", "game-b", "Game B")
+        registry = ServiceRegistry(services_dir, cache_file=tmp_path / "cache.json")
+        
+        loaded = []
+        load_one = registry_module._load_one
+        monkeypatch.setattr(
+            registry_module, "_load_one",
+            lambda json_file: loaded.append(json_file.name) or load_one(json_file)
+        )
+        
+        config_file = services_dir / "b.json"
+        write_config(config_file, "game-b", "Renamed B")
+        bump_mtime(config_file)
+        registry.reload()
+        
+        assert loaded == ["b.json"]
+        assert registry.get_config("game-a").name == "Game A"
+        assert registry.get_config("game-b").name == "Renamed B"
+    
+    def test_reload_follows_symlink_target_with_same_mtime(self, tmp_path):
+        """Test that reload picks up a repointed config symlink even if mtimes match."""
+        services_dir = tmp_path / "services"
+        services_dir.mkdir()
+        store = tmp_path / "store"
+        store.mkdir()
+        
+        old_target = store / "old-game.json"
+        new_target = store / "new-game.json"
+        write_config(old_target, "test-game", "Test Game")
+        write_config(new_target, "test-game", "Test Game v2")
+        os.utime(old_target, ns=(1_000_000_000, 1_000_000_000))
+        os.utime(new_target, ns=(1_000_000_000, 1_000_000_000))
+        
+        link = services_dir / "test.json"
+        link.symlink_to(old_target)
+        registry = ServiceRegistry(services_dir, cache_file=tmp_path / "cache.json")
+        assert registry.get_config("test-game").name == "Test Game"
+        
+        link.unlink()
+        link.symlink_to(new_target)
+        registry.reload()
+        assert registry.get_config("test-game").name == "Test Game v2"
@@ -1,9 +1,35 @@
 """Tests for SteamCMD service."""
 
+import struct
 from pathlib import Path
 
 from gameserver.models import GameSource, ServiceConfig
-from gameserver.services.steam import SteamCMDService
+from gameserver.services import steam
+from gameserver.services.steam import (
+    SteamCMDService,
+    _find_store_interpreter,
+    _patch_interpreter,
+    _read_elf_interpreter,
+)
+from tests.helpers import make_config
+
+
+def build_elf(machine: int = 62, interpreter: bytes | None = b"/lib64/ld-linux-x86-64.so.2") -> bytes:
+    """Build a minimal ELF64 image with an optional PT_INTERP segment."""
+    phoff = 64
+    phentsize = 56
+    interp_offset = phoff + phentsize
+    header = (
+        b"\x7fELF" + bytes([2, 1, 1]) + bytes(9)
+        + struct.pack("<HHIQQQIHHHHHH", 2, machine, 1, 0, phoff, 0, 0, 64, phentsize, 1, 0, 0, 0)
+    )
+    if interpreter is None:
+        # A single PT_LOAD segment
+        program_header = struct.pack("<IIQQQQQQ", 1, 5, 0, 0, 0, 0, 0, 0x1000)
+        return header + program_header
+    data = interpreter + b"\0"
+    program_header = struct.pack("<IIQQQQQQ", 3, 4, interp_offset, 0, 0, len(data), len(data), 1)
+    return header + program_header + data
 
 
 class TestSteamCMDService:
@@ -65,3 +91,57 @@ class TestSteamCMDService:
             "+quit"
         ]
         assert cmd == expected
+    
+    def test_detects_dynamic_x86_64_elf(self, tmp_path):
+        """Test ELF header parsing used to decide which files to patch."""
+        dynamic = tmp_path / "dynamic"
+        dynamic.write_bytes(build_elf())
+        static = tmp_path / "static"
+        static.write_bytes(build_elf(interpreter=None))
+        arm = tmp_path / "arm"
+        arm.write_bytes(build_elf(machine=183))
+        script = tmp_path / "script.sh"
+        script.write_text("#!/bin/sh\necho not an elf file, just a shell script here\n" * 2)
+        
+        assert _read_elf_interpreter(dynamic) == "/lib64/ld-linux-x86-64.so.2"
+        assert _read_elf_interpreter(static) is None
+        assert _read_elf_interpreter(arm) is None
+        assert _read_elf_interpreter(script) is None
+    
+    def test_skips_already_patched_executables(self, tmp_path, monkeypatch):
+        """Test that patchelf only runs when the interpreter differs."""
+        calls = []
+        monkeypatch.setattr(steam.subprocess, "run", lambda cmd, **_kwargs: calls.append(cmd))
+        loader = "/nix/store/bbbb-glibc-2.39-52/lib64/ld-linux-x86-64.so.2"
+        patched = tmp_path / "patched"
+        patched.write_bytes(build_elf(interpreter=loader.encode()))
+        unpatched = tmp_path / "unpatched"
+        unpatched.write_bytes(build_elf())
+        
+        _patch_interpreter(patched, loader)
+        _patch_interpreter(unpatched, loader)
+        
+        assert calls == [["patchelf", "--set-interpreter", loader, str(unpatched)]]
+    
+    def test_find_store_interpreter(self, tmp_path):
+        """Test locating the glibc loader among hash-prefixed store paths."""
+        (tmp_path / "aaaa-glibc-2.39-52-dev").mkdir()
+        (tmp_path / "bbbb-glibc-2.39-52" / "lib64").mkdir(parents=True)
+        loader = tmp_path / "bbbb-glibc-2.39-52" / "lib64" / "ld-linux-x86-64.so.2"
+        loader.touch()
+        (tmp_path / "cccc-hello-2.12").mkdir()
+        
+        assert _find_store_interpreter(str(tmp_path)) == str(loader)
+        assert _find_store_interpreter(str(tmp_path / "missing")) is None
+    
+    def test_validate_detects_changed_executable(self, tmp_path):
+        """Test that validation compares the executable against the marker."""
+        config = make_config(game_dir=tmp_path)
+        config.executable.write_bytes(b"x" * 100)
+        service = SteamCMDService()
+        service._create_download_marker(config)
+        
+        assert service.validate_game_files(config)
+        
+        config.executable.write_bytes(b"x" * 10)
+        assert not service.validate_game_files(config)
@@ -1,6 +1,19 @@
 """Tests for systemd service."""
 
+import subprocess
+import time
+
+from gameserver.services import systemd
 from gameserver.services.systemd import SystemdService
+from tests.helpers import make_config
+
+SHOW_OUTPUT = """\
+ActiveState=active
+LoadState=loaded
+
+ActiveState=inactive
+LoadState=not-found
+"""
 
 
 class TestSystemdService:
@@ -16,3 +29,67 @@ class TestSystemdService:
         """Test getting status of non-existent service."""
         status = SystemdService.get_status("nonexistent-service-12345")
         assert status in ["inactive", "unknown"]
+    
+    def test_get_status_many_nonexistent_services(self):
+        """Test getting status of several non-existent services at once."""
+        units = ["nonexistent-service-12345", "nonexistent-service-67890"]
+        statuses = SystemdService.get_status_many(units)
+        assert list(statuses) == units
+        assert all(status in ["inactive", "unknown"] for status in statuses.values())
+    
+    def test_query_states_parses_show_blocks(self, monkeypatch):
+        """Test splitting batched systemctl show output per unit."""
+        calls = []
+        
+        def fake_run(cmd, **_kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, stdout=SHOW_OUTPUT, stderr="")
+        
+        monkeypatch.setattr(systemd.subprocess, "run", fake_run)
+        
+        statuses = SystemdService.get_status_many(["game-a", "game-b"])
+        assert statuses == {"game-a": "active", "game-b": "inactive"}
+        assert len(calls) == 1
+        assert calls[0][-3:] == ["--", "game-a", "game-b"]
+    
+    def test_is_managed_uses_load_state(self, monkeypatch):
+        """Test that units with LoadState=not-found are not managed."""
+        def fake_run(cmd, **_kwargs):
+            state = "not-found" if cmd[-1] == "missing" else "loaded"
+            stdout = f"ActiveState=inactive\nLoadState={state}\n"
+            return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
+        
+        monkeypatch.setattr(systemd.subprocess, "run", fake_run)
+        
+        assert SystemdService.is_managed("game-a") is True
+        assert SystemdService.is_managed("missing") is False
+    
+    def test_is_managed_when_query_fails(self, monkeypatch):
+        """Test that a failed systemctl query does not report the unit as unmanaged."""
+        def fake_run(cmd, **_kwargs):
+            return subprocess.CompletedProcess(cmd, 1, stdout="", stderr="Failed to connect to bus")
+        
+        monkeypatch.setattr(systemd.subprocess, "run", fake_run)
+        
+        assert SystemdService.is_managed("game-a") is True
+    
+    def test_restart_waits_for_unit_to_be_collected(self, monkeypatch):
+        """Test that restart starts the unit only once systemd has unloaded it."""
+        states = iter([
+            {"ActiveState": "deactivating", "LoadState": "loaded"},
+            {"ActiveState": "inactive", "LoadState": "loaded"},
+            {"ActiveState": "inactive", "LoadState": "not-found"},
+        ])
+        events = []
+        
+        monkeypatch.setattr(
+            SystemdService, "query_states",
+            staticmethod(lambda unit_names: {unit_names[0]: next(states)})
+        )
+        monkeypatch.setattr(SystemdService, "stop_service", staticmethod(lambda _config: events.append("stop")))
+        monkeypatch.setattr(SystemdService, "start_service", staticmethod(lambda _config: events.append("start")))
+        monkeypatch.setattr(time, "sleep", lambda delay: events.append(delay))
+        
+        SystemdService.restart_service(make_config())
+        
+        assert events == ["stop", 0.05, 0.1, "start"]
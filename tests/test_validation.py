@@ -0,0 +1,181 @@
+"""Tests for validation service."""
+
+from datetime import datetime
+
+import pytest
+
+from gameserver.exceptions import ValidationError
+from gameserver.models import DownloadMarker, GameSource
+from gameserver.services.validation import ValidationService
+from tests.helpers import bump_mtime, make_config
+
+
+def write_marker(marker_file, source_id="294420", status="success", executable_size=None):
+    """Write a download marker file for a Steam app."""
+    now = datetime(2026, 1, 1, 10, 0, 0)
+    marker = DownloadMarker(
+        timestamp=now,
+        game_source=GameSource(type="steam", source_id=source_id),
+        download_status=status,
+        game_dir=marker_file.parent,
+        file_count=1,
+        total_size="1.0K",
+        validation_status="passed",
+        last_updated=now,
+        executable_size=executable_size
+    )
+    marker_file.write_text(marker.model_dump_json(indent=2))
+
+
+class TestValidateDownloadMarker:
+    """Test download marker parsing."""
+    
+    def test_missing_marker(self, tmp_path):
+        """Test that a missing marker file is not an error."""
+        assert ValidationService.validate_download_marker(tmp_path / "missing") is None
+    
+    def test_marker_below_regular_file(self, tmp_path):
+        """Test that a game directory that is a regular file counts as missing."""
+        game_dir = tmp_path / "game"
+        game_dir.write_text("not a directory")
+        marker_file = game_dir / ".steamcmd-completed"
+        
+        assert ValidationService.validate_download_marker(marker_file) is None
+        assert ValidationService.needs_download(marker_file, GameSource(type="steam", source_id="294420"))
+    
+    def test_invalid_marker(self, tmp_path):
+        """Test that a corrupt marker file raises."""
+        marker_file = tmp_path / ".steamcmd-completed"
+        marker_file.write_text("{not json")
+        with pytest.raises(ValidationError):
+            ValidationService.validate_download_marker(marker_file)
+    
+    def test_oversized_marker(self, tmp_path):
+        """Test that a marker too large to be genuine is rejected unread."""
+        marker_file = tmp_path / ".steamcmd-completed"
+        with open(marker_file, "wb") as f:
+            f.truncate(1024 * 1024)
+        with pytest.raises(ValidationError, match="implausibly large"):
+            ValidationService.validate_download_marker(marker_file)
+    
+    def test_parsed_marker_reused_until_changed(self, tmp_path):
+        """Test that an unchanged marker is parsed once and a rewrite is picked up."""
+        marker_file = tmp_path / ".steamcmd-completed"
+        write_marker(marker_file)
+        
+        first = ValidationService.validate_download_marker(marker_file)
+        assert ValidationService.validate_download_marker(marker_file) is first
+        
+        write_marker(marker_file, source_id="380870")
+        bump_mtime(marker_file)
+        assert ValidationService.validate_download_marker(marker_file).game_source.source_id == "380870"
+
+
+class TestValidateGameFiles:
+    """Test game file validation."""
+    
+    def test_valid_install(self, tmp_path):
+        """Test that an executable plus a matching marker passes."""
+        config = make_config(game_dir=tmp_path)
+        config.executable.write_bytes(b"\x7fELF")
+        write_marker(tmp_path / ".steamcmd-completed")
+        
+        ValidationService.validate_game_files(config)
+    
+    def test_missing_or_non_file_executable(self, tmp_path):
+        """Test the executable existence and file type checks."""
+        config = make_config(game_dir=tmp_path)
+        with pytest.raises(ValidationError, match="not found"):
+            ValidationService.validate_game_files(config)
+        
+        config.executable.mkdir()
+        with pytest.raises(ValidationError, match="not a file"):
+            ValidationService.validate_game_files(config)
+
+    
+    def test_executable_size_checked_against_marker(self, tmp_path):
+        """Test that a replaced executable fails the recorded size check."""
+        config = make_config(game_dir=tmp_path)
+        config.executable.write_bytes(b"x" * 100)
+        write_marker(tmp_path / ".steamcmd-completed", executable_size=100)
+        ValidationService.validate_game_files(config)
+        
+        config.executable.write_bytes(b"x" * 10)
+        with pytest.raises(ValidationError, match="changed since download"):
+            ValidationService.validate_game_files(config)
+    
+    def test_game_dir_is_regular_file(self, tmp_path):
+        """Test that an executable below a regular file is reported as not found."""
+        game_dir = tmp_path / "game"
+        game_dir.write_text("not a directory")
+        config = make_config(game_dir=game_dir)
+        
+        with pytest.raises(ValidationError, match="not found"):
+            ValidationService.validate_game_files(config)
+    
+    def test_validate_many(self, tmp_path):
+        """Test that each configuration gets its own result."""
+        valid = make_config(game_dir=tmp_path)
+        valid.executable.write_bytes(b"\x7fELF")
+        write_marker(tmp_path / ".steamcmd-completed")
+        missing = make_config(game_dir=tmp_path).model_copy(
+            update={"id": "other-game", "executable": tmp_path / "missing"}
+        )
+        
+        results = ValidationService.validate_many([valid, missing])
+        
+        assert results["test-game"] is None
+        assert isinstance(results["other-game"], ValidationError)
+
+    
+    def test_results_cached_until_files_change(self, tmp_path):
+        """Test that validation outcomes are reused while files are unchanged."""
+        config = make_config(game_dir=tmp_path)
+        config.executable.write_bytes(b"\x7fELF")
+        marker_file = tmp_path / ".steamcmd-completed"
+        write_marker(marker_file, status="failed")
+        
+        first = ValidationService.validate_many([config])["test-game"]
+        assert isinstance(first, ValidationError)
+        assert ValidationService.validate_many([config])["test-game"] is first
+        
+        write_marker(marker_file)
+        bump_mtime(marker_file)
+        assert ValidationService.validate_many([config])["test-game"] is None
+        
+        ValidationService.clear_cache()
+        assert ValidationService.validate_many([config])["test-game"] is None
+
+
+class TestNeedsDownload:
+    """Test download decisions from the marker file."""
+    
+    def test_needs_download(self, tmp_path):
+        """Test missing, matching, mismatched and corrupt markers."""
+        marker_file = tmp_path / ".steamcmd-completed"
+        source = GameSource(type="steam", source_id="294420")
+        assert ValidationService.needs_download(marker_file, source)
+        
+        # A recent miss is remembered until the marker is invalidated
+        write_marker(marker_file)
+        assert ValidationService.needs_download(marker_file, source)
+        ValidationService.invalidate(marker_file)
+        assert not ValidationService.needs_download(marker_file, source)
+        assert ValidationService.needs_download(marker_file, source, force=True)
+        assert ValidationService.needs_download(
+            marker_file, GameSource(type="steam", source_id="380870")
+        )
+        
+        marker_file.write_text("{not json")
+        assert ValidationService.needs_download(marker_file, source)
+    
+    def test_unreadable_marker(self, tmp_path, monkeypatch):
+        """Test that stat errors other than ENOENT still mean a download is needed."""
+        from gameserver.services import validation
+        
+        def denied(_path):
+            raise PermissionError(13, "Permission denied")
+        
+        monkeypatch.setattr(validation, "_stat_or_none", denied)
+        source = GameSource(type="steam", source_id="294420")
+        assert ValidationService.needs_download(tmp_path / ".steamcmd-completed", source)